@@ -134,19 +134,19 @@ def compute_outcomes_for_event(conn: Any, cfg: Config, event_key: EventKey) -> N
 
 
 def _load_prices(conn: Any, issuer_cik: str) -> List[Tuple[str, float]]:
-    rows = conn.execute(
+    rows = conn.cursor(dict_rows=False).execute(
         "SELECT date, adj_close FROM issuer_prices_daily WHERE issuer_cik=? ORDER BY date ASC",
         (issuer_cik,),
     ).fetchall()
-    return [(str(r["date"]), float(r["adj_close"])) for r in rows]
+    return [(str(r[0]), float(r[1])) for r in rows]
 
 
 def _load_benchmark_prices(conn: Any, symbol: str) -> List[Tuple[str, float]]:
-    rows = conn.execute(
+    rows = conn.cursor(dict_rows=False).execute(
         "SELECT date, adj_close FROM benchmark_prices_daily WHERE symbol=? ORDER BY date ASC",
         (symbol,),
     ).fetchall()
-    return [(str(r["date"]), float(r["adj_close"])) for r in rows]
+    return [(str(r[0]), float(r[1])) for r in rows]
 
 
 def _find_anchor_index(dates: List[str], trade_date: Any) -> Optional[int]:
@@ -297,15 +297,7 @@ def _compute_side(
                 else:
                     bench_reason_180 = "insufficient_benchmark_future_data"
 
-    # Excess returns only when both are available.
-    excess_60 = None
-    if out["return_60d"] is not None and bench_return_60 is not None:
-        excess_60 = float(out["return_60d"]) - float(bench_return_60)
-
-    excess_180 = None
-    if out["return_180d"] is not None and bench_return_180 is not None:
-        excess_180 = float(out["return_180d"]) - float(bench_return_180)
-
+    # excess_return_* are generated columns (return - bench_return, NULL if either is missing).
     now = utcnow_iso()
     conn.execute(
         """
@@ -313,11 +305,11 @@ def _compute_side(
             issuer_cik, owner_key, accession_number, side,
             trade_date, anchor_trading_date, p0,
             future_date_60d, future_price_60d, return_60d, missing_reason_60d,
-            bench_symbol, bench_return_60d, bench_missing_reason_60d, excess_return_60d,
+            bench_symbol, bench_return_60d, bench_missing_reason_60d,
             future_date_180d, future_price_180d, return_180d, missing_reason_180d,
-            bench_return_180d, bench_missing_reason_180d, excess_return_180d,
+            bench_return_180d, bench_missing_reason_180d,
             outcomes_version, computed_at
-        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
         ON CONFLICT(issuer_cik, owner_key, accession_number, side) DO UPDATE SET
             trade_date=excluded.trade_date,
             anchor_trading_date=excluded.anchor_trading_date,
@@ -329,14 +321,12 @@ def _compute_side(
             bench_symbol=excluded.bench_symbol,
             bench_return_60d=excluded.bench_return_60d,
             bench_missing_reason_60d=excluded.bench_missing_reason_60d,
-            excess_return_60d=excluded.excess_return_60d,
             future_date_180d=excluded.future_date_180d,
             future_price_180d=excluded.future_price_180d,
             return_180d=excluded.return_180d,
             missing_reason_180d=excluded.missing_reason_180d,
             bench_return_180d=excluded.bench_return_180d,
             bench_missing_reason_180d=excluded.bench_missing_reason_180d,
-            excess_return_180d=excluded.excess_return_180d,
             outcomes_version=excluded.outcomes_version,
             computed_at=excluded.computed_at
         """,
@@ -355,14 +345,12 @@ def _compute_side(
             bench_symbol,
             bench_return_60,
             bench_reason_60,
-            excess_60,
             out["future_date_180d"],
             out["future_price_180d"],
             out["return_180d"],
             out["missing_reason_180d"],
             bench_return_180,
             bench_reason_180,
-            excess_180,
             cfg.CURRENT_OUTCOMES_VERSION,
             now,
         ),
@@ -370,8 +358,8 @@ def _compute_side(
 
     _debug(
         f"Outcomes computed for {event_key} side={side} anchor={anchor_date} "
-        f"r60={out['return_60d']} br60={bench_return_60} ex60={excess_60} "
-        f"r180={out['return_180d']} br180={bench_return_180} ex180={excess_180}"
+        f"r60={out['return_60d']} br60={bench_return_60} "
+        f"r180={out['return_180d']} br180={bench_return_180}"
     )
 
 
@@ -395,11 +383,11 @@ def _upsert_missing(
             issuer_cik, owner_key, accession_number, side,
             trade_date, anchor_trading_date, p0,
             future_date_60d, future_price_60d, return_60d, missing_reason_60d,
-            bench_symbol, bench_return_60d, bench_missing_reason_60d, excess_return_60d,
+            bench_symbol, bench_return_60d, bench_missing_reason_60d,
             future_date_180d, future_price_180d, return_180d, missing_reason_180d,
-            bench_return_180d, bench_missing_reason_180d, excess_return_180d,
+            bench_return_180d, bench_missing_reason_180d,
             outcomes_version, computed_at
-        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
         ON CONFLICT(issuer_cik, owner_key, accession_number, side) DO UPDATE SET
             trade_date=excluded.trade_date,
             anchor_trading_date=excluded.anchor_trading_date,
@@ -411,14 +399,12 @@ def _upsert_missing(
             bench_symbol=excluded.bench_symbol,
             bench_return_60d=NULL,
             bench_missing_reason_60d=excluded.bench_missing_reason_60d,
-            excess_return_60d=NULL,
             future_date_180d=NULL,
             future_price_180d=NULL,
             return_180d=NULL,
             missing_reason_180d=excluded.missing_reason_180d,
             bench_return_180d=NULL,
             bench_missing_reason_180d=excluded.bench_missing_reason_180d,
-            excess_return_180d=NULL,
             outcomes_version=excluded.outcomes_version,
             computed_at=excluded.computed_at
         """,
@@ -440,11 +426,9 @@ def _upsert_missing(
             None,
             None,
             None,
-            None,
             reason,
             None,
             bench_missing_reason,
-            None,
             cfg.CURRENT_OUTCOMES_VERSION,
             now,
         ),
@@ -0,0 +1,66 @@
+"""Shared close-price technicals used by trend context and the trade plan.
+
+compute_trend_for_event needs only the trend scalars and compute_trade_plan_for_event only
+the support/resistance levels, so each gets its own function over the same adjusted-close
+series. Windows are taken with slices + builtins (min/max/fsum).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional, Sequence, Tuple
+
+TrendStats = Tuple[
+    Optional[float],  # ret20
+    Optional[float],  # ret60
+    Optional[float],  # dist_hi (52w, anchor inclusive)
+    Optional[float],  # dist_lo (52w, anchor inclusive)
+    Optional[float],  # sma50
+    Optional[float],  # sma200
+]
+
+Levels = Tuple[
+    Optional[float],  # sup20 (pre-anchor 20D low)
+    Optional[float],  # sup60 (pre-anchor 60D low)
+    Optional[float],  # res20 (pre-anchor 20D high)
+    Optional[float],  # res60 (pre-anchor 60D high)
+    Optional[float],  # res252 (pre-anchor 252D high)
+]
+
+
+def trend_stats(closes: Sequence[float], i: int) -> TrendStats:
+    """Trend scalars for anchor index ``i`` of ``closes``.
+
+    Returns (ret20, ret60, dist_hi, dist_lo, sma50, sma200). All include the anchor close and
+    are None when there is not enough history before ``i``.
+    """
+    c = closes[i]
+
+    ret20 = (c / closes[i - 20]) - 1.0 if i >= 20 else None
+    ret60 = (c / closes[i - 60]) - 1.0 if i >= 60 else None
+
+    dist_hi: Optional[float] = None
+    dist_lo: Optional[float] = None
+    if i >= 251:
+        window_52w = closes[i - 251 : i + 1]
+        dist_hi = (c / max(window_52w)) - 1.0
+        dist_lo = (c / min(window_52w)) - 1.0
+
+    sma50 = math.fsum(closes[i - 49 : i + 1]) / 50.0 if i >= 49 else None
+    sma200 = math.fsum(closes[i - 199 : i + 1]) / 200.0 if i >= 199 else None
+
+    return (ret20, ret60, dist_hi, dist_lo, sma50, sma200)
+
+
+def support_resistance_levels(closes: Sequence[float], i: int) -> Levels:
+    """Support/resistance levels for anchor index ``i`` of ``closes``.
+
+    Returns (sup20, sup60, res20, res60, res252) over the sessions strictly *before* the
+    anchor; when fewer than N sessions exist the whole pre-anchor history is used (all None
+    if there is none).
+    """
+    if i < 1:
+        return (None, None, None, None, None)
+    pre20 = closes[max(0, i - 20) : i]
+    pre60 = closes[max(0, i - 60) : i]
+    return (min(pre20), min(pre60), max(pre20), max(pre60), max(closes[max(0, i - 252) : i]))
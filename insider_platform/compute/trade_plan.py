@@ -17,9 +17,14 @@ import math
 from datetime import date
 from typing import Any, Dict, List, Optional, Tuple
 
+from insider_platform.compute.technicals import support_resistance_levels
 from insider_platform.config import Config
 
 
+# AI buy_signal statuses that carry a usable rating/confidence.
+_APPLICABLE_STATUSES = frozenset({"applicable", "insufficient_data"})
+
+
 def _clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
@@ -79,8 +84,9 @@ def _extract_buy_signal_strength(
         if isinstance(verdict, dict):
             buy = verdict.get("buy_signal")
             if isinstance(buy, dict):
-                status = str(buy.get("status") or "").strip().lower()
-                if status in ("applicable", "insufficient_data"):
+                status_raw = buy.get("status")
+                status = status_raw.strip().lower() if isinstance(status_raw, str) else ""
+                if status in _APPLICABLE_STATUSES:
                     rating = _safe_float(buy.get("rating"))
                     conf = _safe_float(buy.get("confidence"))
 
@@ -126,7 +132,8 @@ def _fetch_lookback_closes(
     limit: int = 400,
 ) -> List[Tuple[str, float]]:
     """Return ascending (date, adj_close) series up to end_date (inclusive)."""
-    rows = conn.execute(
+    # Tuple rows: positional access avoids building a dict per price row.
+    rows = conn.cursor(dict_rows=False).execute(
         """
         SELECT date, adj_close
         FROM issuer_prices_daily
@@ -136,13 +143,8 @@ def _fetch_lookback_closes(
         """,
         (issuer_cik, end_date, int(limit)),
     ).fetchall()
-    out: List[Tuple[str, float]] = []
-    for r in reversed(rows):
-        try:
-            out.append((str(r["date"]), float(r["adj_close"])) )
-        except Exception:
-            continue
-    return out
+    # Drop NULL/NaN/inf closes in one pass instead of a per-row try/except.
+    return [(str(d), float(px)) for d, px in reversed(rows) if px is not None and math.isfinite(px)]
 
 
 def compute_trade_plan_for_event(
@@ -199,9 +201,12 @@ def compute_trade_plan_for_event(
                 },
             )
 
-    issuer_cik = str(event.get("issuer_cik") or "").zfill(10)
-    if not issuer_cik:
+    # NOTE: keep every cheap (in-memory) eligibility check above the first DB query;
+    # rejected events should never touch issuer_prices_daily.
+    issuer_cik_raw = str(event.get("issuer_cik") or "").strip()
+    if not issuer_cik_raw:
         return _ineligible("Missing issuer CIK.")
+    issuer_cik = issuer_cik_raw.zfill(10)
 
     # Use trend anchor date when available; otherwise fall back.
     target_date = (
@@ -237,16 +242,8 @@ def compute_trade_plan_for_event(
     if len(pre) < 20:
         return _ineligible("Insufficient pre-entry history for technical levels.")
 
-    def _window(vals: List[float], n: int) -> List[float]:
-        if len(vals) <= n:
-            return vals
-        return vals[-n:]
-
-    support20 = min(_window(pre, 20))
-    support60 = min(_window(pre, 60)) if len(pre) >= 60 else min(pre)
-    res20 = max(_window(pre, 20))
-    res60 = max(_window(pre, 60)) if len(pre) >= 60 else max(pre)
-    res252 = max(_window(pre, 252)) if len(pre) >= 252 else max(pre)
+    # Levels are computed over the pre-entry sessions (entry is the anchor index).
+    support20, support60, res20, res60, res252 = support_resistance_levels(closes, len(closes) - 1)
 
     # Stop-loss: use 20D low unless it's too close, else 60D low.
     buffer_pct = 0.02
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from statistics import mean
+import math
 from typing import Any, List, Tuple, Optional
 
+from insider_platform.compute.technicals import trend_stats
 from insider_platform.models import EventKey
 from insider_platform.util.time import utcnow_iso
 
@@ -85,19 +86,7 @@ def compute_trend_for_event(conn: Any, event_key: EventKey) -> None:
     anchor_date = dates[i]
     close_anchor = closes[i]
 
-    close_20 = closes[i - 20]
-    close_60 = closes[i - 60]
-    ret_20 = (close_anchor / close_20) - 1.0
-    ret_60 = (close_anchor / close_60) - 1.0
-
-    window_52w = closes[i - 251 : i + 1]
-    high_52 = max(window_52w)
-    low_52 = min(window_52w)
-    dist_high = (close_anchor / high_52) - 1.0
-    dist_low = (close_anchor / low_52) - 1.0
-
-    sma50 = mean(closes[i - 49 : i + 1])
-    sma200 = mean(closes[i - 199 : i + 1])
+    ret_20, ret_60, dist_high, dist_low, sma50, sma200 = trend_stats(closes, i)
     above50 = 1 if close_anchor > sma50 else 0
     above200 = 1 if close_anchor > sma200 else 0
 
@@ -133,11 +122,13 @@ def compute_trend_for_event(conn: Any, event_key: EventKey) -> None:
 
 
 def _load_prices(conn: Any, issuer_cik: str) -> List[Tuple[str, float]]:
-    rows = conn.execute(
+    # Tuple rows: positional access avoids building a dict per price row.
+    rows = conn.cursor(dict_rows=False).execute(
         "SELECT date, adj_close FROM issuer_prices_daily WHERE issuer_cik=? ORDER BY date ASC",
         (issuer_cik,),
     ).fetchall()
-    return [(r["date"], float(r["adj_close"])) for r in rows]
+    # Non-finite closes would poison SMA/min/max; drop them up front.
+    return [(d, float(px)) for d, px in rows if px is not None and math.isfinite(px)]
 
 
 def _set_trend_missing(conn: Any, event_key: EventKey, reason: str) -> None:
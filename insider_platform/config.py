@@ -114,6 +114,14 @@ class Config:
 
     # Worker
     WORKER_POLL_SECONDS: float = float(os.environ.get("WORKER_POLL_SECONDS", "1.0"))
+    # DB-only jobs claimed (and committed) together per worker transaction; jobs that call
+    # SEC/EODHD/Gemini always run in a transaction of their own.
+    WORKER_CLAIM_BATCH_SIZE: int = int(os.environ.get("WORKER_CLAIM_BATCH_SIZE", "10"))
+    # Concurrent claim loops in the API (network-bound) worker.
+    API_WORKER_CONCURRENCY: int = int(os.environ.get("API_WORKER_CONCURRENCY", "4"))
+    # Worker processes for the compute (CPU-bound) worker; opt-in, capped at the CPU count.
+    # Each process holds its own DB pool + LISTEN connection and runs AI jobs concurrently.
+    COMPUTE_WORKER_PROCESSES: int = int(os.environ.get("COMPUTE_WORKER_PROCESSES", "1"))
 
     # Optional: SEC "current" Form 4 poller.
     # If enabled, the worker will periodically poll the SEC current filings feed
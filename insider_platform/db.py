@@ -1,9 +1,28 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import re
+import select
+import threading
+import time
+import zlib
 from contextlib import contextmanager
-from typing import Any, Iterator, List, Optional, Sequence
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
 
-from insider_platform.schema import get_schema_sql
+try:
+    import psycopg2
+    import psycopg2.extensions
+    import psycopg2.extras
+    import psycopg2.pool
+
+    _HAS_PSYCOPG2 = True
+except ImportError:  # pragma: no cover
+    psycopg2 = None  # type: ignore[assignment]
+    _HAS_PSYCOPG2 = False
+
+from insider_platform.schema import get_schema_sql, get_schema_statements
 from insider_platform.util.time import utcnow_iso
 
 
@@ -11,56 +30,46 @@ def _debug(msg: str) -> None:
     print(f"[db] {msg}")
 
 
+# Quoted literals/identifiers (with '' / "" escapes; an unterminated quote runs to the end)
+# or a bare qmark. Only the bare-qmark branch is rewritten.
+_QMARK_RE = re.compile(r"'(?:''|[^'])*(?:'|\Z)|\"(?:\"\"|[^\"])*(?:\"|\Z)|\?")
+
+
+def _qmark_sub(m: "re.Match[str]") -> str:
+    tok = m.group(0)
+    return "%s" if tok == "?" else tok
+
+
+@functools.lru_cache(maxsize=1024)
 def _qmark_to_pct(sql: str) -> str:
     """Convert qmark placeholders (?) to psycopg2 placeholders (%s).
 
     We avoid replacing '?' inside single/double-quoted string literals.
     This is not a full SQL parser, but it is sufficient for this codebase.
+    The scan runs inside the C regex engine rather than a per-character Python loop.
+    SQL templates here are string literals (a bounded set), so results are memoized.
     """
-    out: List[str] = []
-    in_single = False
-    in_double = False
-    i = 0
-    while i < len(sql):
-        ch = sql[i]
-
-        if ch == "'" and not in_double:
-            out.append(ch)
-            if in_single:
-                # Escaped single quote: ''
-                if i + 1 < len(sql) and sql[i + 1] == "'":
-                    out.append("'")
-                    i += 2
-                    continue
-                in_single = False
-            else:
-                in_single = True
-            i += 1
-            continue
-
-        if ch == '"' and not in_single:
-            out.append(ch)
-            if in_double:
-                # Escaped double quote: ""
-                if i + 1 < len(sql) and sql[i + 1] == '"':
-                    out.append('"')
-                    i += 2
-                    continue
-                in_double = False
-            else:
-                in_double = True
-            i += 1
-            continue
-
-        if ch == "?" and not in_single and not in_double:
-            out.append("%s")
-            i += 1
-            continue
-
-        out.append(ch)
-        i += 1
-
-    return "".join(out)
+    if "?" not in sql:
+        return sql
+    if "'" not in sql and '"' not in sql:
+        # No quoted sections, so every '?' is a placeholder.
+        return sql.replace("?", "%s")
+    return _QMARK_RE.sub(_qmark_sub, sql)
+
+
+@functools.lru_cache(maxsize=256)
+def _qmark_to_dollar(sql: str) -> Tuple[str, int]:
+    """Convert qmark placeholders to PREPARE-style $1..$n; returns (sql, n)."""
+    n = 0
+
+    def sub(m: "re.Match[str]") -> str:
+        nonlocal n
+        if m.group(0) != "?":
+            return m.group(0)
+        n += 1
+        return f"${n}"
+
+    return _QMARK_RE.sub(sub, sql), n
 
 
 class PGCursor:
@@ -68,13 +77,39 @@ class PGCursor:
         self._cur = cur
 
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> "PGCursor":
-        self._cur.execute(_qmark_to_pct(sql), tuple(params or ()))
+        self._cur.execute(_qmark_to_pct(sql), () if not params else tuple(params))
         return self
 
     def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> "PGCursor":
         self._cur.executemany(_qmark_to_pct(sql), [tuple(x) for x in seq_of_params])
         return self
 
+    def executemany_fast(
+        self,
+        sql: str,
+        seq_of_params: Sequence[Sequence[Any]],
+        *,
+        template: Optional[str] = None,
+        page_size: int = 1000,
+        fetch: bool = False,
+    ) -> Any:
+        """Bulk variant of executemany built on psycopg2.extras.execute_values.
+
+        ``sql`` must contain a single ``VALUES %s`` (not ``VALUES (?, ?, ?)``); rows are
+        sent as multi-row VALUES lists, ``page_size`` rows per statement, instead of one
+        round trip per row. Other ``?`` placeholders in the template are not supported.
+        ``template`` is execute_values' per-row snippet, e.g. ``"(%s, 'pending', %s)"``.
+        With fetch=True the RETURNING rows of every page are returned as a list.
+        """
+        return psycopg2.extras.execute_values(
+            self._cur,
+            sql,
+            [tuple(x) for x in seq_of_params],
+            template=template,
+            page_size=page_size,
+            fetch=fetch,
+        )
+
     def fetchone(self) -> Any:
         return self._cur.fetchone()
 
@@ -94,16 +129,42 @@ class PGCursor:
         except Exception:
             pass
 
-    def __del__(self) -> None:
-        try:
-            self.close()
-        except Exception:
-            pass
+    @property
+    def connection(self) -> Any:
+        """The underlying psycopg2 connection.
+
+        Pass this (not the wrapper) to psycopg2 helpers that take a connection or cursor,
+        e.g. ``psycopg2.extensions.quote_ident(name, cur.connection)``.
+        """
+        return self._cur.connection
+
+    def __enter__(self) -> "PGCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._cur, name)
 
 
+if _HAS_PSYCOPG2:
+
+    class TrackingConnection(psycopg2.extensions.connection):
+        """psycopg2 connection that remembers which named statements it has PREPAREd.
+
+        Prepared statements live as long as the server session, so the registry lives on
+        the raw connection (which the pool reuses), not on the per-checkout wrapper.
+        """
+
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            self.prepared: set = set()
+
+else:  # pragma: no cover
+    TrackingConnection = None  # type: ignore[assignment,misc]
+
+
 class PGConnection:
     """A tiny adapter that exposes a minimal DB-API-like API on top of psycopg2."""
 
@@ -124,8 +185,31 @@ class PGConnection:
         wrapper.executemany(sql, seq_of_params)
         return wrapper
 
-    def cursor(self) -> PGCursor:
-        return PGCursor(self._conn.cursor())
+    def executemany_fast(
+        self,
+        sql: str,
+        seq_of_params: Sequence[Sequence[Any]],
+        *,
+        template: Optional[str] = None,
+        page_size: int = 1000,
+        fetch: bool = False,
+    ) -> Any:
+        """See PGCursor.executemany_fast (``INSERT ... VALUES %s`` templates)."""
+        cur = PGCursor(self._conn.cursor())
+        return cur.executemany_fast(
+            sql, seq_of_params, template=template, page_size=page_size, fetch=fetch
+        )
+
+    def cursor(self, *, dict_rows: bool = True) -> PGCursor:
+        """Return a cursor wrapper.
+
+        dict_rows=False yields plain tuples instead of RealDictCursor rows; use it for
+        hot loops that only need positional access (no per-row dict allocation).
+        """
+        if dict_rows:
+            return PGCursor(self._conn.cursor())
+
+        return PGCursor(self._conn.cursor(cursor_factory=psycopg2.extensions.cursor))
 
     def commit(self) -> None:
         self._conn.commit()
@@ -137,116 +221,371 @@ class PGConnection:
         self._conn.close()
 
 
+_POOLS: Dict[Tuple[str, int], Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _pool_max() -> int:
+    try:
+        return max(1, int(os.environ.get("INSIDER_PG_POOL_MAX", "16")))
+    except ValueError:
+        return 16
+
+
+def _get_pool(dsn: str) -> Any:
+    """Return the process-wide ThreadedConnectionPool for ``dsn`` (created lazily).
+
+    Keyed by pid as well so a forked child never reuses its parent's sockets.
+    """
+    key = (dsn, os.getpid())
+    pool = _POOLS.get(key)
+    if pool is not None:
+        return pool
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = psycopg2.pool.ThreadedConnectionPool(
+                1,
+                _pool_max(),
+                dsn=dsn,
+                connection_factory=TrackingConnection,
+                cursor_factory=psycopg2.extras.RealDictCursor,
+            )
+            _POOLS[key] = pool
+    return pool
+
+
 @contextmanager
-def connect(db_dsn: str) -> Iterator[PGConnection]:
-    """Connect to PostgreSQL and yield a connection wrapper."""
+def connect(db_dsn: str, *, pooled: bool = True) -> Iterator[PGConnection]:
+    """Check out a pooled PostgreSQL connection and yield a connection wrapper.
+
+    Commits on success, rolls back on error, then returns the connection to the pool.
+    If the pool is exhausted (or pooled=False, e.g. for a long-lived LISTEN session) a
+    dedicated connection is opened and closed afterwards.
+    """
     dsn = (db_dsn or "").strip()
     if not dsn:
         raise RuntimeError("DB_DSN is empty; set INSIDER_DATABASE_URL (or DATABASE_URL)")
 
-    try:
-        import psycopg2
-        import psycopg2.extras
-    except Exception as e:
-        raise RuntimeError(
-            "psycopg2 is required for PostgreSQL support. Install psycopg2-binary and try again."
-        ) from e
+    if not _HAS_PSYCOPG2:
+        raise RuntimeError("psycopg2 is required for PostgreSQL support. Install psycopg2-binary and try again.")
+
+    pool = _get_pool(dsn) if pooled else None
+    raw = None
+    if pool is not None:
+        try:
+            raw = pool.getconn()
+        except psycopg2.pool.PoolError:
+            _debug("connection pool exhausted; opening a dedicated connection")
+            pool = None
+    if raw is None:
+        raw = psycopg2.connect(
+            dsn, connection_factory=TrackingConnection, cursor_factory=psycopg2.extras.RealDictCursor
+        )
 
-    raw = psycopg2.connect(dsn, cursor_factory=psycopg2.extras.RealDictCursor)
     conn = PGConnection(raw)
+    broken = False
     try:
         yield conn
         conn.commit()
     except Exception:
-        conn.rollback()
+        try:
+            conn.rollback()
+        except Exception:
+            # Connection is unusable (e.g. server restart); don't hand it back out.
+            broken = True
         raise
     finally:
-        conn.close()
+        if pool is None:
+            raw.close()
+        else:
+            pool.putconn(raw, close=broken or bool(raw.closed))
+
+
+def execute_prepared(conn: PGConnection, name: str, sql: str, params: Sequence[Any] = ()) -> PGCursor:
+    """Run qmark ``sql`` as the server-side prepared statement ``name`` (parse/plan once).
+
+    The statement is PREPAREd the first time this session sees ``name``; later calls only
+    send EXECUTE. ``name`` must uniquely identify ``sql``. Falls back to a plain execute on
+    connections that don't track prepared statements.
+    """
+    prepared = getattr(conn._conn, "prepared", None)
+    if prepared is None:
+        return conn.execute(sql, params)
+    if name not in prepared:
+        dollar_sql, _n = _qmark_to_dollar(sql)
+        conn.execute(f"PREPARE {name} AS {dollar_sql}")
+        prepared.add(name)
+    if not params:
+        return conn.execute(f"EXECUTE {name}")
+    return conn.execute(f"EXECUTE {name}({','.join(['?'] * len(params))})", params)
+
+
+def wait_for_notifies(conn: PGConnection, channel: str, timeout_seconds: float) -> List[str]:
+    """Wait up to ``timeout_seconds`` for NOTIFYs on ``channel``; return their payloads.
+
+    LISTENs once per connection (committed immediately so it takes effect). Use a dedicated
+    connection (connect(..., pooled=False)); a pooled session would keep the LISTEN and
+    buffer notifications after it is returned.
+    """
+    raw = conn._conn
+    listening = getattr(conn, "_listening", None)
+    if listening is None:
+        listening = set()
+        conn._listening = listening
+    if channel not in listening:
+        conn.execute(f"LISTEN {channel}")
+        conn.commit()
+        listening.add(channel)
+
+    deadline = time.monotonic() + max(0.0, float(timeout_seconds))
+    while True:
+        raw.poll()
+        if raw.notifies:
+            out = [n.payload for n in raw.notifies if n.channel == channel]
+            raw.notifies.clear()
+            if out:
+                return out
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return []
+        select.select([raw], [], [], remaining)
+
+
+_SCHEMA_FINGERPRINT_KEY = "schema_fingerprint"
+
+# Two-int advisory lock key: a project-scoped classid keeps us out of the single-bigint
+# key space other tools on the same database use.
+_SCHEMA_LOCK_CLASSID = zlib.crc32(b"insider_platform") & 0x7FFFFFFF
+_SCHEMA_LOCK_OBJID = 1
+
+
+def _schema_fingerprint(ddl: str) -> str:
+    return hashlib.blake2b(ddl.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def init_db(db_dsn: str) -> None:
-    """Create all tables and run lightweight migrations."""
+    """Create all tables and run lightweight migrations.
+
+    The schema DDL is skipped when its fingerprint matches the one recorded in app_config
+    by the last successful run; _migrate always runs (its probes are idempotent).
+    """
     _debug(f"Initializing DB (postgres) at {db_dsn}")
     with connect(db_dsn) as conn:
-        # Ensure only one process runs schema DDL at a time (session-level lock).
-        conn.execute("SELECT pg_advisory_lock(2147483647);")
-        try:
-            _exec_schema(conn, get_schema_sql())
-            _migrate(conn)
-        except Exception:
-            # If a DDL statement fails, PostgreSQL marks the current transaction as aborted.
-            # Roll back so we can safely release the advisory lock and re-raise.
-            conn.rollback()
-            raise
-        finally:
-            try:
-                conn.execute("SELECT pg_advisory_unlock(2147483647);")
-            except Exception:
-                # If unlock fails for any reason, we don't want to hide the real error.
-                pass
+        # Ensure only one process runs schema DDL at a time. Transaction-scoped, so the
+        # commit (or rollback on error) in connect() releases it.
+        conn.execute("SELECT pg_advisory_xact_lock(?, ?)", (_SCHEMA_LOCK_CLASSID, _SCHEMA_LOCK_OBJID))
+        ddl = get_schema_sql()
+        fingerprint = _schema_fingerprint(ddl)
+        if _table_exists(conn, "app_config") and get_app_config(conn, _SCHEMA_FINGERPRINT_KEY) == fingerprint:
+            _debug("Schema DDL unchanged; skipping")
+        else:
+            _exec_schema(conn, ddl)
+            # Tables may have been created; drop any "missing table" answers cached above.
+            _column_cache(conn).clear()
+            upsert_app_config(conn, _SCHEMA_FINGERPRINT_KEY, fingerprint)
+        _migrate(conn)
 
 
 def _exec_schema(conn: Any, ddl: str) -> None:
-    # Execute multi-statement DDL (naive split is OK for our schema)
-    statements = [s.strip() for s in (ddl or "").split(";") if s.strip()]
-    for stmt in statements:
+    # Send the whole multi-statement script in one simple-query round trip (no params, so
+    # psycopg2 passes it through verbatim). If it fails, roll back to the savepoint and
+    # replay statement by statement so the error points at the offending statement.
+    conn.execute("SAVEPOINT exec_schema")
+    try:
+        with conn._conn.cursor() as cur:
+            cur.execute(ddl)
+    except Exception as e:
+        _debug(f"Batched schema DDL failed ({e}); retrying per statement")
+        conn.execute("ROLLBACK TO SAVEPOINT exec_schema")
+    else:
+        conn.execute("RELEASE SAVEPOINT exec_schema")
+        return
+
+    for stmt in get_schema_statements():
         conn.execute(stmt)
 
 
+def _column_cache(conn: Any) -> Dict[str, FrozenSet[str]]:
+    # Per-connection memo of {table: column names}; lives as long as the connection.
+    cache = getattr(conn, "_col_cache", None)
+    if cache is None:
+        cache = {}
+        conn._col_cache = cache
+    return cache
+
+
+def _warm_table_columns(conn: Any, tables: Sequence[str]) -> None:
+    """Load the column sets of several tables with a single pg_catalog query."""
+    cache = _column_cache(conn)
+    missing = [t for t in tables if t not in cache]
+    if not missing:
+        return
+    with conn.cursor(dict_rows=False) as cur:
+        rows = cur.execute(
+            """
+            SELECT c.relname, a.attname
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname='public' AND c.relname = ANY(?::name[])
+              AND a.attnum > 0 AND NOT a.attisdropped
+            """,
+            (missing,),
+        ).fetchall()
+    found: Dict[str, set] = {t: set() for t in missing}
+    for table_name, column_name in rows:
+        found.setdefault(str(table_name), set()).add(str(column_name))
+    for t, cols in found.items():
+        cache[t] = frozenset(cols)
+
+
+def _table_columns_cached(conn: Any, table: str) -> FrozenSet[str]:
+    cols = _column_cache(conn).get(table)
+    if cols is None:
+        _warm_table_columns(conn, (table,))
+        cols = _column_cache(conn)[table]
+    return cols
+
+
+def _forget_table_columns(conn: Any, table: str) -> None:
+    # Call after DDL that changes a table's columns.
+    _column_cache(conn).pop(table, None)
+
+
+def _relation_exists(conn: Any, name: str) -> bool:
+    # Tables, indexes (including constraint-backing ones), sequences, views.
+    with conn.cursor(dict_rows=False) as cur:
+        r = cur.execute("SELECT to_regclass(?)", (f"public.{name}",)).fetchone()
+    return r is not None and r[0] is not None
+
+
 def _table_exists(conn: Any, table: str) -> bool:
-    r = conn.execute(
-        """
-        SELECT 1
-        FROM information_schema.tables
-        WHERE table_schema='public' AND table_name=?
-        LIMIT 1
-        """,
-        (table,),
-    ).fetchone()
-    return r is not None
+    if _table_columns_cached(conn, table):
+        return True
+    # No columns cached: either missing or a zero-column table. One OID lookup settles it.
+    return _relation_exists(conn, table)
 
 
 def _has_column(conn: Any, table: str, col: str) -> bool:
-    r = conn.execute(
-        """
-        SELECT 1
-        FROM information_schema.columns
-        WHERE table_schema='public'
-          AND table_name=?
-          AND column_name=?
-        LIMIT 1
-        """,
-        (table, col),
-    ).fetchone()
-    return r is not None
+    return col in _table_columns_cached(conn, table)
 
 
-def _table_columns(conn: Any, table: str) -> List[str]:
-    rows = conn.execute(
-        """
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_schema='public' AND table_name=?
-        ORDER BY ordinal_position
-        """,
-        (table,),
-    ).fetchall()
-    return [str(r["column_name"]) for r in rows]
+def _column_type(conn: Any, table: str, col: str) -> Optional[str]:
+    """SQL type of ``public.table.col`` (format_type spelling, e.g. 'text', 'jsonb'), or None."""
+    with conn.cursor(dict_rows=False) as cur:
+        r = cur.execute(
+            """
+            SELECT format_type(a.atttypid, a.atttypmod)
+            FROM pg_catalog.pg_attribute a
+            WHERE a.attrelid = to_regclass(?) AND a.attname = ?
+              AND a.attnum > 0 AND NOT a.attisdropped
+            """,
+            (f"public.{table}", col),
+        ).fetchone()
+    return str(r[0]) if r is not None else None
+
+
+def _columns_of_type(conn: Any, table: str, cols: Sequence[str], type_name: str) -> List[str]:
+    """Those of ``cols`` on ``public.table`` whose type is ``type_name`` (one catalog query)."""
+    with conn.cursor(dict_rows=False) as cur:
+        rows = cur.execute(
+            """
+            SELECT a.attname
+            FROM pg_catalog.pg_attribute a
+            WHERE a.attrelid = to_regclass(?) AND a.attname = ANY(?::name[])
+              AND a.attnum > 0 AND NOT a.attisdropped
+              AND format_type(a.atttypid, a.atttypmod) = ?
+            """,
+            (f"public.{table}", list(cols), type_name),
+        ).fetchall()
+    return [str(r[0]) for r in rows]
+
+
+# 0/1 flag columns stored as SMALLINT (older DBs created them as INTEGER).
+_FLAG_COLUMNS = {
+    "users": ("is_active", "cancel_at_period_end"),
+    "form4_rows_raw": ("is_derivative",),
+    "insider_events": (
+        "is_officer",
+        "is_director",
+        "is_ten_percent_owner",
+        "has_buy",
+        "buy_vwap_is_partial",
+        "has_sell",
+        "sell_vwap_is_partial",
+        "trend_above_sma_50",
+        "trend_above_sma_200",
+        "cluster_flag_buy",
+        "cluster_flag_sell",
+    ),
+}
+
+
+# event_outcomes derived columns (mirrors schema.py).
+_EXCESS_RETURN_COLUMNS = {
+    "excess_return_60d": "DOUBLE PRECISION GENERATED ALWAYS AS (return_60d - bench_return_60d) STORED",
+    "excess_return_180d": "DOUBLE PRECISION GENERATED ALWAYS AS (return_180d - bench_return_180d) STORED",
+}
+
+
+def _generated_columns(conn: Any, table: str) -> FrozenSet[str]:
+    with conn.cursor(dict_rows=False) as cur:
+        rows = cur.execute(
+            """
+            SELECT a.attname
+            FROM pg_catalog.pg_attribute a
+            WHERE a.attrelid = to_regclass(?) AND a.attgenerated <> ''
+              AND a.attnum > 0 AND NOT a.attisdropped
+            """,
+            (f"public.{table}",),
+        ).fetchall()
+    return frozenset(str(r[0]) for r in rows)
+
+
+# Storage parameters for update-heavy tables (free page space keeps updates HOT).
+# Mirrors the WITH (...) clauses in schema.py so older DBs pick them up too.
+_TABLE_STORAGE_OPTIONS = {
+    "jobs": ("fillfactor=70",),
+    "insider_events": ("fillfactor=80", "autovacuum_vacuum_scale_factor=0.05"),
+}
+
+
+def _table_reloptions(conn: Any, table: str) -> FrozenSet[str]:
+    with conn.cursor(dict_rows=False) as cur:
+        r = cur.execute(
+            "SELECT reloptions FROM pg_catalog.pg_class WHERE oid = to_regclass(?)",
+            (f"public.{table}",),
+        ).fetchone()
+    return frozenset(r[0] or ()) if r is not None else frozenset()
+
+
+def _add_missing_columns(conn: Any, table: str, cols: Sequence[Tuple[str, str]]) -> None:
+    """Add whichever ``(name, type)`` columns ``table`` lacks in a single ALTER TABLE."""
+    missing = [(col, ctype) for col, ctype in cols if not _has_column(conn, table, col)]
+    if missing:
+        conn.execute(f"ALTER TABLE {table} " + ", ".join(f"ADD COLUMN {c} {t}" for c, t in missing))
+        _forget_table_columns(conn, table)
 
 
 def _migrate(conn: Any) -> None:
     """Lightweight forward-only migrations for existing DBs."""
 
+    # One catalog round trip for every table probed below (instead of one per column).
+    _warm_table_columns(
+        conn, ("ai_outputs", "issuer_fundamentals_cache", "event_outcomes", "users", "app_config", "jobs")
+    )
+
     # --- AI outputs: ensure input_json exists (older DBs) ---
     if _table_exists(conn, "ai_outputs") and not _has_column(conn, "ai_outputs", "input_json"):
         conn.execute("ALTER TABLE ai_outputs ADD COLUMN input_json TEXT NOT NULL DEFAULT ''")
+        _forget_table_columns(conn, "ai_outputs")
 
     # --- Fundamentals cache: sector + beta ---
     if _table_exists(conn, "issuer_fundamentals_cache"):
-        if not _has_column(conn, "issuer_fundamentals_cache", "sector"):
-            conn.execute("ALTER TABLE issuer_fundamentals_cache ADD COLUMN sector TEXT")
-        if not _has_column(conn, "issuer_fundamentals_cache", "beta"):
-            conn.execute("ALTER TABLE issuer_fundamentals_cache ADD COLUMN beta DOUBLE PRECISION")
+        _add_missing_columns(
+            conn, "issuer_fundamentals_cache", [("sector", "TEXT"), ("beta", "DOUBLE PRECISION")]
+        )
         # Helpful for sorting/grouping by sector
         conn.execute("CREATE INDEX IF NOT EXISTS idx_fundamentals_sector ON issuer_fundamentals_cache (sector)")
 
@@ -256,14 +595,30 @@ def _migrate(conn: Any) -> None:
             ("bench_symbol", "TEXT"),
             ("bench_return_60d", "DOUBLE PRECISION"),
             ("bench_missing_reason_60d", "TEXT"),
-            ("excess_return_60d", "DOUBLE PRECISION"),
             ("bench_return_180d", "DOUBLE PRECISION"),
             ("bench_missing_reason_180d", "TEXT"),
-            ("excess_return_180d", "DOUBLE PRECISION"),
         ]
-        for col, ctype in cols_to_add:
-            if not _has_column(conn, "event_outcomes", col):
-                conn.execute(f"ALTER TABLE event_outcomes ADD COLUMN {col} {ctype}")
+        _add_missing_columns(conn, "event_outcomes", cols_to_add)
+
+        # excess_return_* are generated from return/bench_return; older DBs stored them as
+        # plain columns written by the app. Re-create those (one table rewrite, once).
+        generated = _generated_columns(conn, "event_outcomes")
+        plain = [c for c in _EXCESS_RETURN_COLUMNS if _has_column(conn, "event_outcomes", c) and c not in generated]
+        missing = [c for c in _EXCESS_RETURN_COLUMNS if not _has_column(conn, "event_outcomes", c)]
+        if plain or missing:
+            _debug(f"Re-creating event_outcomes excess return columns as generated: {plain + missing}")
+            clauses = [f"DROP COLUMN {c}" for c in plain]
+            clauses += [f"ADD COLUMN {c} {_EXCESS_RETURN_COLUMNS[c]}" for c in plain + missing]
+            conn.execute("ALTER TABLE event_outcomes " + ", ".join(clauses))
+        _forget_table_columns(conn, "event_outcomes")
+
+        # Per-owner stats read only the excess returns: index-only scans via INCLUDE.
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_outcomes_stats_cover ON event_outcomes (issuer_cik, owner_key, side)
+            INCLUDE (excess_return_60d, excess_return_180d)
+            """
+        )
 
     # --- users: billing / subscription columns (Stripe) ---
     if _table_exists(conn, "users") and _has_column(conn, "users", "user_id"):
@@ -273,16 +628,83 @@ def _migrate(conn: Any) -> None:
             ("stripe_price_id", "TEXT"),
             ("subscription_status", "TEXT"),
             ("current_period_end", "TEXT"),
-            ("cancel_at_period_end", "INTEGER"),
+            # Keep defaults lightweight; the application treats missing/NULL as "no subscription".
+            ("cancel_at_period_end", "SMALLINT NOT NULL DEFAULT 0"),
             ("subscription_updated_at", "TEXT"),
         ]
-        for col, ctype in user_cols_to_add:
-            if not _has_column(conn, "users", col):
-                # Keep defaults lightweight; the application treats missing/NULL as "no subscription".
-                if col == "cancel_at_period_end":
-                    conn.execute(f"ALTER TABLE users ADD COLUMN {col} {ctype} NOT NULL DEFAULT 0")
-                else:
-                    conn.execute(f"ALTER TABLE users ADD COLUMN {col} {ctype}")
+        _add_missing_columns(conn, "users", user_cols_to_add)
+
+    # --- jobs: integer run_after_ms for the claim predicate ---
+    if _table_exists(conn, "jobs") and not _has_column(conn, "jobs", "run_after_ms"):
+        _debug("Adding jobs.run_after_ms")
+        conn.execute("ALTER TABLE jobs ADD COLUMN run_after_ms BIGINT")
+        conn.execute(
+            """
+            UPDATE jobs
+            SET run_after_ms = (EXTRACT(EPOCH FROM run_after::timestamptz) * 1000)::bigint
+            WHERE run_after IS NOT NULL AND run_after <> ''
+            """
+        )
+        _forget_table_columns(conn, "jobs")
+    # Claim path: index-ordered scan of pending jobs (matches claim_next_jobs' ORDER BY).
+    if _relation_exists(conn, "idx_jobs_claim"):
+        conn.execute("DROP INDEX idx_jobs_claim")
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_claim_ms ON jobs (priority DESC, created_at ASC, job_id ASC)
+        INCLUDE (run_after_ms, job_type) WHERE status='pending'
+        """
+    )
+
+    # --- jobs: dedupe on a BIGINT hash of dedupe_key instead of the TEXT key ---
+    if not _has_column(conn, "jobs", "dedupe_hash"):
+        _debug("Adding jobs.dedupe_hash")
+        conn.execute(
+            "ALTER TABLE jobs ADD COLUMN dedupe_hash BIGINT GENERATED ALWAYS AS (hashtextextended(dedupe_key, 0)) STORED"
+        )
+        _forget_table_columns(conn, "jobs")
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_dedupe_hash ON jobs (dedupe_hash)")
+    if _relation_exists(conn, "jobs_dedupe_key_key"):
+        conn.execute("ALTER TABLE jobs DROP CONSTRAINT jobs_dedupe_key_key")
+
+    # --- jobs: payload_json TEXT -> JSONB (one-time table rewrite on older DBs) ---
+    if _column_type(conn, "jobs", "payload_json") == "text":
+        _debug("Migrating jobs.payload_json to JSONB")
+        conn.execute("ALTER TABLE jobs ALTER COLUMN payload_json TYPE JSONB USING payload_json::jsonb")
+
+    # --- form4_rows_raw.owner_name_hash: hex TEXT -> BYTEA digest ---
+    if _column_type(conn, "form4_rows_raw", "owner_name_hash") == "text":
+        _debug("Migrating form4_rows_raw.owner_name_hash to BYTEA")
+        conn.execute(
+            "ALTER TABLE form4_rows_raw ALTER COLUMN owner_name_hash TYPE BYTEA USING decode(owner_name_hash, 'hex')"
+        )
+        _forget_table_columns(conn, "form4_rows_raw")
+
+    # --- Drop secondary indexes that duplicate (a prefix of) the primary key ---
+    for idx in (
+        "idx_prices_issuer_date",
+        "idx_benchmark_prices_symbol_date",
+        "idx_stats_issuer_owner",
+        "idx_rows_accession",  # superseded by idx_rows_accession_issuer
+        "idx_outcomes_issuer_owner_side",  # superseded by idx_outcomes_stats_cover
+    ):
+        conn.execute(f"DROP INDEX IF EXISTS {idx}")
+
+    # --- Storage parameters (metadata only; applies to pages written from now on) ---
+    for table, opts in _TABLE_STORAGE_OPTIONS.items():
+        if not set(opts) <= _table_reloptions(conn, table):
+            _debug(f"Setting storage parameters on {table}: {opts}")
+            conn.execute(f"ALTER TABLE {table} SET ({', '.join(opts)})")
+
+    # --- 0/1 flags: INTEGER -> SMALLINT (one table rewrite per table, once) ---
+    for table, flag_cols in _FLAG_COLUMNS.items():
+        int_cols = _columns_of_type(conn, table, flag_cols, "integer")
+        if int_cols:
+            _debug(f"Narrowing {table} flag columns to SMALLINT: {int_cols}")
+            conn.execute(
+                f"ALTER TABLE {table} " + ", ".join(f"ALTER COLUMN {c} TYPE SMALLINT" for c in int_cols)
+            )
+            _forget_table_columns(conn, table)
 
 
 def upsert_app_config(conn: Any, key: str, value: str) -> None:
@@ -290,7 +712,7 @@ def upsert_app_config(conn: Any, key: str, value: str) -> None:
 
     Older DBs may have an extra NOT NULL `updated_at` column. We support both schemas.
     """
-    cols = _table_columns(conn, "app_config")
+    cols = _table_columns_cached(conn, "app_config")
     now = utcnow_iso()
 
     if "updated_at" in cols:
@@ -313,7 +735,8 @@ def upsert_app_config(conn: Any, key: str, value: str) -> None:
 
 
 def get_app_config(conn: Any, key: str) -> Optional[str]:
-    row = conn.execute("SELECT value FROM app_config WHERE key=?", (key,)).fetchone()
+    with conn.cursor(dict_rows=False) as cur:
+        row = cur.execute("SELECT value FROM app_config WHERE key=?", (key,)).fetchone()
     if row is None:
         return None
-    return str(row["value"])
+    return str(row[0])
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Optional: faster JSON decoding (falls back to the stdlib via requests).
+    import orjson as _orjson
+except Exception:  # pragma: no cover
+    _orjson = None
+
+
+# CODE.EXCHANGE, e.g. AAPL.US, VOD.L
+_EODHD_SYM_RE = re.compile(r"^[A-Za-z0-9\-]+\.[A-Za-z]{2,4}$")
 
 
 @dataclass(frozen=True)
@@ -16,6 +28,60 @@ def _debug(msg: str) -> None:
     print(f"[eodhd] {msg}")
 
 
+def _make_session() -> requests.Session:
+    # Keep-alive + connection pool shared by all EODHD calls (skips the TCP/TLS handshake
+    # on repeat calls). Transient 429/5xx responses are retried with backoff; after the
+    # last retry the response is returned so callers still see the status code.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    s = requests.Session()
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+_SESSION = _make_session()
+
+
+def _json(r: requests.Response, empty: Any) -> Any:
+    if not r.content:
+        return empty
+    if _orjson is not None:
+        return _orjson.loads(r.content)
+    return r.json()
+
+
+def _pick_close(row: Dict[str, Any]) -> Any:
+    adj = row.get("adjusted_close")
+    if adj is None:
+        adj = row.get("adj_close")
+    if adj is None:
+        adj = row.get("close")
+    return adj
+
+
+def _row_to_eod(row: Dict[str, Any]) -> Optional[EODRow]:
+    """EODRow for one payload row, or None if it has no date/close or is malformed."""
+    try:
+        d = str(row.get("date") or "").strip()
+        adj = _pick_close(row)
+        if d and adj is not None:
+            return EODRow(date=d, adj_close=float(adj))
+    except Exception:
+        pass
+    return None
+
+
+def _parse_eod_rows(data: List[Dict[str, Any]]) -> List[EODRow]:
+    return [r for r in map(_row_to_eod, data) if r is not None]
+
+
 def resolve_symbol(base_url: str, api_key: str, ticker: str) -> str:
     """Resolve a DB ticker to an EODHD symbol.
 
@@ -29,18 +95,16 @@ def resolve_symbol(base_url: str, api_key: str, ticker: str) -> str:
         raise RuntimeError("Ticker is blank; cannot resolve EODHD symbol")
     # Some SEC tickers contain '.' (e.g. BRK.B) but are NOT EODHD symbols.
     # Treat as already-resolved only when it looks like CODE.EXCHANGE (e.g. AAPL.US, VOD.L).
-    if "." in t:
-        import re
-        if re.match(r"^[A-Za-z0-9\-]+\.[A-Za-z]{2,4}$", t):
-            return t
+    if "." in t and _EODHD_SYM_RE.match(t):
+        return t
 
     url = f"{base_url.rstrip('/')}/search/{t}"
     params = {"api_token": api_key, "fmt": "json"}
     _debug(f"Resolving symbol via search: {url}")
-    r = requests.get(url, params=params, timeout=60)
+    r = _SESSION.get(url, params=params, timeout=60)
     if r.status_code != 200:
         raise RuntimeError(f"EODHD search error {r.status_code}: {r.text}")
-    results = r.json() if r.text else []
+    results = _json(r, [])
     if not isinstance(results, list) or not results:
         raise RuntimeError(f"EODHD search returned no results for {t}")
 
@@ -78,36 +142,22 @@ def fetch_eod_prices(
         "to": end_date,
     }
     _debug(f"Fetching EOD prices: {url} from={start_date} to={end_date}")
-    r = requests.get(url, params=params, timeout=120)
+    r = _SESSION.get(url, params=params, timeout=120)
     if r.status_code != 200:
         raise RuntimeError(f"EODHD eod error {r.status_code}: {r.text}")
 
-    data = r.json()
+    data = _json(r, [])
     if not isinstance(data, list):
         raise RuntimeError(f"EODHD eod returned unexpected payload: {data}")
 
-    out: List[EODRow] = []
-    for row in data:
-        try:
-            d = str(row.get("date") or "").strip()
-            if not d:
-                continue
-            adj = row.get("adjusted_close")
-            if adj is None:
-                adj = row.get("adj_close")
-            if adj is None:
-                adj = row.get("close")
-            if adj is None:
-                continue
-            out.append(EODRow(date=d, adj_close=float(adj)))
-        except Exception:
-            continue
+    out = _parse_eod_rows(data)
 
     if not out:
         raise RuntimeError(f"No price rows returned for symbol {symbol}")
 
     return out
 
+
 def fetch_fundamentals(
     base_url: str,
     api_key: str,
@@ -120,10 +170,10 @@ def fetch_fundamentals(
     url = f"{base_url.rstrip('/')}/fundamentals/{symbol}"
     params = {"api_token": api_key, "fmt": "json"}
     _debug(f"Fetching fundamentals: {url}")
-    r = requests.get(url, params=params, timeout=120)
+    r = _SESSION.get(url, params=params, timeout=120)
     if r.status_code != 200:
         raise RuntimeError(f"EODHD fundamentals error {r.status_code}: {r.text}")
-    data = r.json() if r.text else {}
+    data = _json(r, {})
     if not isinstance(data, dict):
         raise RuntimeError(f"EODHD fundamentals returned unexpected payload: {data}")
     return data
@@ -165,11 +215,11 @@ def fetch_news(
         params["to"] = date_to
 
     _debug(f"Fetching news: {url} symbol={symbol} tag={tag} limit={limit} offset={offset}")
-    r = requests.get(url, params=params, timeout=120)
+    r = _SESSION.get(url, params=params, timeout=120)
     if r.status_code != 200:
         raise RuntimeError(f"EODHD news error {r.status_code}: {r.text}")
 
-    data = r.json() if r.text else []
+    data = _json(r, [])
     if not isinstance(data, list):
         raise RuntimeError(f"EODHD news returned unexpected payload: {data}")
     return data
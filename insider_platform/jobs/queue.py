@@ -1,27 +1,88 @@
 from __future__ import annotations
 
-import json
+import functools
+import logging
+import time
+import zlib
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Sequence
+from datetime import datetime, timezone
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
-from insider_platform.util.time import utcnow_iso
+from insider_platform.db import connect, execute_prepared, wait_for_notifies
+from insider_platform.util import jsonutil
+from insider_platform.util.time import iso_from_epoch, utcnow_iso
 
 
-def _debug(msg: str) -> None:
-    print(f"[jobs] {msg}")
+# Enqueue/requeue chatter is per-job, so it goes to a logger at DEBUG (lazy %-formatting)
+# rather than print().
+logger = logging.getLogger(__name__)
+
+
+_MISSING: Any = object()
 
 
-@dataclass(frozen=True)
 class Job:
-    job_id: int
+    """A claimed job. ``payload`` is decoded from the stored JSON on first access."""
+
+    __slots__ = (
+        "job_id",
+        "job_type",
+        "status",
+        "priority",
+        "dedupe_key",
+        "payload_raw",
+        "attempts",
+        "max_attempts",
+        "_payload_cache",
+    )
+
+    def __init__(
+        self,
+        job_id: int,
+        job_type: str,
+        status: str,
+        priority: int,
+        dedupe_key: str,
+        payload_raw: str,
+        attempts: int,
+        max_attempts: int,
+    ):
+        self.job_id = job_id
+        self.job_type = job_type
+        self.status = status
+        self.priority = priority
+        self.dedupe_key = dedupe_key
+        self.payload_raw = payload_raw  # payload_json as stored
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self._payload_cache: Any = _MISSING
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        c = self._payload_cache
+        if c is _MISSING:
+            c = jsonutil.loads(self.payload_raw) if self.payload_raw else {}
+            self._payload_cache = c
+        return c
+
+    def __repr__(self) -> str:
+        return f"Job(job_id={self.job_id!r}, job_type={self.job_type!r}, status={self.status!r})"
+
+
+@dataclass(frozen=True)
+class EnqueueSpec:
+    """One job for enqueue_jobs_bulk (same fields/defaults as enqueue_job's arguments)."""
+
     job_type: str
-    status: str
-    priority: int
     dedupe_key: str
     payload: Dict[str, Any]
-    attempts: int
-    max_attempts: int
+    priority: int = 100
+    max_attempts: int = 3
+    run_after: Optional[str] = None
+    requeue_if_exists: bool = False
+    promote_if_pending: bool = False
+    # Pre-encoded ``payload`` (e.g. shared by several specs); skips the per-spec dumps.
+    payload_json: Optional[str] = None
 
 
 def enqueue_job(
@@ -35,196 +96,415 @@ def enqueue_job(
     run_after: Optional[str] = None,
     requeue_if_exists: bool = False,
     promote_if_pending: bool = False,
+    payload_json: Optional[str] = None,
 ) -> None:
     """Enqueue a job with dedupe.
 
     This codebase targets PostgreSQL only (via docker).
     """
-    now = utcnow_iso()
-    payload_json = json.dumps(payload, ensure_ascii=False)
+    enqueue_jobs_bulk(
+        conn,
+        [
+            EnqueueSpec(
+                job_type=job_type,
+                dedupe_key=dedupe_key,
+                payload=payload,
+                priority=priority,
+                max_attempts=max_attempts,
+                run_after=run_after,
+                requeue_if_exists=requeue_if_exists,
+                promote_if_pending=promote_if_pending,
+                payload_json=payload_json,
+            )
+        ],
+    )
 
-    inserted = conn.execute(
-        """
-        INSERT INTO jobs (job_type, status, priority, dedupe_key, payload_json, attempts, max_attempts, last_error, created_at, updated_at, run_after)
-        VALUES (?, 'pending', ?, ?, ?, 0, ?, NULL, ?, ?, ?)
-        ON CONFLICT(dedupe_key) DO NOTHING
-        RETURNING job_id
-        """,
-        (job_type, priority, dedupe_key, payload_json, max_attempts, now, now, run_after),
-    ).fetchone()
 
-    if inserted is not None:
-        _debug(f"Enqueued job {job_type} dedupe_key={dedupe_key}")
-        return
+# ON CONFLICT actions keyed by (requeue_if_exists, promote_if_pending):
+# - no requeue: keep the existing job untouched
+# - requeue: reset terminal (success/error) jobs to pending
+# - requeue + promote: additionally refresh a still-pending job (run_after cleared), unless
+#   it already matches (then no row version / WAL is written and it logs as skipped)
+# Running jobs are never touched. Dedupe is on dedupe_hash (64-bit hash of dedupe_key);
+# the key equality check keeps a (vanishingly unlikely) hash collision from overwriting a
+# different job, and _check_hash_collisions raises rather than let it skip one.
+_ON_CONFLICT = {
+    (False, False): "DO NOTHING",
+    (False, True): "DO NOTHING",
+    (True, False): """DO UPDATE SET
+            status='pending',
+            priority=EXCLUDED.priority,
+            payload_json=EXCLUDED.payload_json,
+            attempts=0,
+            max_attempts=EXCLUDED.max_attempts,
+            last_error=NULL,
+            updated_at=EXCLUDED.updated_at,
+            run_after=EXCLUDED.run_after,
+            run_after_ms=EXCLUDED.run_after_ms
+        WHERE jobs.status IN ('success','error') AND jobs.dedupe_key = EXCLUDED.dedupe_key""",
+    (True, True): """DO UPDATE SET
+            status='pending',
+            priority=EXCLUDED.priority,
+            payload_json=EXCLUDED.payload_json,
+            attempts=0,
+            max_attempts=EXCLUDED.max_attempts,
+            last_error=NULL,
+            updated_at=EXCLUDED.updated_at,
+            run_after=CASE WHEN jobs.status='pending' THEN NULL ELSE EXCLUDED.run_after END,
+            run_after_ms=CASE WHEN jobs.status='pending' THEN NULL ELSE EXCLUDED.run_after_ms END
+        WHERE jobs.status <> 'running' AND jobs.dedupe_key = EXCLUDED.dedupe_key
+          AND (jobs.status <> 'pending'
+               OR jobs.payload_json IS DISTINCT FROM EXCLUDED.payload_json
+               OR jobs.priority IS DISTINCT FROM EXCLUDED.priority
+               OR jobs.max_attempts IS DISTINCT FROM EXCLUDED.max_attempts
+               OR jobs.run_after IS NOT NULL
+               OR jobs.attempts <> 0
+               OR jobs.last_error IS NOT NULL)""",
+}
+
+
+def enqueue_jobs_bulk(conn: Any, jobs: Sequence[EnqueueSpec]) -> int:
+    """Enqueue many jobs with dedupe; one INSERT ... ON CONFLICT per requeue/promote mode.
+
+    Insert, requeue and promote are fused into the ON CONFLICT clause, so each job costs no
+    extra round trips. Within one call only the first spec per dedupe_key is applied.
+    Returns the number of newly inserted jobs.
+    """
+    return _write_enqueue(conn, _encode_enqueue(jobs))
+
 
-    # Dedupe hit
-    if not requeue_if_exists:
-        _debug(f"Skipped enqueue (dedupe exists) {job_type} dedupe_key={dedupe_key}")
-        return
+_EncodedEnqueue = Dict[Tuple[bool, bool], List[Tuple[EnqueueSpec, Tuple[Any, ...]]]]
 
-    # Requeue logic: only reset if the existing job is terminal.
-    row = conn.execute(
-        "SELECT job_id, status FROM jobs WHERE dedupe_key=?",
-        (dedupe_key,),
-    ).fetchone()
-    if row is None:
-        return
-
-    status = str(row["status"])
-    if status == "running":
-        _debug(f"Skipped requeue (already running) {job_type} dedupe_key={dedupe_key}")
-        return
-
-    if status == "pending":
-        if not promote_if_pending:
-            _debug(f"Skipped requeue (already pending) {job_type} dedupe_key={dedupe_key}")
-            return
-
-        conn.execute(
-            """
-            UPDATE jobs
-            SET priority=?,
-                payload_json=?,
-                attempts=0,
-                max_attempts=?,
-                last_error=NULL,
-                run_after=NULL,
-                updated_at=?
-            WHERE dedupe_key=? AND status='pending'
+
+def _encode_enqueue(jobs: Sequence[EnqueueSpec]) -> _EncodedEnqueue:
+    """Dedupe by key (first spec wins), group by ON CONFLICT mode and build INSERT params."""
+    if not jobs:
+        return {}
+
+    now = utcnow_iso()
+    groups: _EncodedEnqueue = {}
+    seen: set[str] = set()
+    for j in jobs:
+        if j.dedupe_key in seen:
+            continue
+        seen.add(j.dedupe_key)
+        params = (
+            j.job_type,
+            j.priority,
+            j.dedupe_key,
+            j.payload_json if j.payload_json is not None else jsonutil.dumps(j.payload),
+            j.max_attempts,
+            now,
+            now,
+            j.run_after,
+            _iso_to_ms(j.run_after) if j.run_after else None,
+        )
+        groups.setdefault((bool(j.requeue_if_exists), bool(j.promote_if_pending)), []).append((j, params))
+    return groups
+
+
+def _write_enqueue(conn: Any, groups: _EncodedEnqueue) -> int:
+    debug = logger.isEnabledFor(logging.DEBUG)
+    inserted_total = 0
+    written_types: set[str] = set()
+    for mode, entries in groups.items():
+        rows = conn.executemany_fast(
+            f"""
+            INSERT INTO jobs (job_type, status, priority, dedupe_key, payload_json, attempts, max_attempts, last_error, created_at, updated_at, run_after, run_after_ms)
+            VALUES %s
+            ON CONFLICT(dedupe_hash) {_ON_CONFLICT[mode]}
+            RETURNING dedupe_key, (xmax = 0) AS inserted
             """,
-            (priority, payload_json, max_attempts, now, dedupe_key),
+            [params for _, params in entries],
+            template="(%s, 'pending', %s, %s, %s, 0, %s, NULL, %s, %s, %s, %s)",
+            fetch=True,
         )
-        _debug(f"Promoted pending job {job_type} dedupe_key={dedupe_key}")
-        return
-
-    conn.execute(
+        written = {str(r["dedupe_key"]): bool(r["inserted"]) for r in rows}
+        skipped = [j.dedupe_key for j, _ in entries if j.dedupe_key not in written]
+        if skipped:
+            _check_hash_collisions(conn, skipped)
+        inserted_total += sum(1 for v in written.values() if v)
+        if written:
+            written_types.update(j.job_type for j, _ in entries if j.dedupe_key in written)
+
+        if debug:
+            for j, _ in entries:
+                was_inserted = written.get(j.dedupe_key)
+                if was_inserted is None:
+                    logger.debug("Skipped enqueue (dedupe exists) %s dedupe_key=%s", j.job_type, j.dedupe_key)
+                elif was_inserted:
+                    logger.debug("Enqueued job %s dedupe_key=%s", j.job_type, j.dedupe_key)
+                else:
+                    logger.debug("Requeued job %s dedupe_key=%s", j.job_type, j.dedupe_key)
+
+    if written_types:
+        notify_enqueued(conn, written_types)
+
+    return inserted_total
+
+
+def _check_hash_collisions(conn: Any, keys: Sequence[str]) -> None:
+    """Raise if a skipped enqueue hit another key's dedupe_hash instead of its own job."""
+    rows = conn.execute(
         """
-        UPDATE jobs
-        SET status='pending',
-            priority=?,
-            payload_json=?,
-            attempts=0,
-            max_attempts=?,
-            last_error=NULL,
-            updated_at=?,
-            run_after=?
-        WHERE dedupe_key=?
+        SELECT k FROM unnest(?::text[]) AS k
+        WHERE NOT EXISTS (SELECT 1 FROM jobs WHERE dedupe_hash = hashtextextended(k, 0) AND dedupe_key = k)
         """,
-        (priority, payload_json, max_attempts, now, run_after, dedupe_key),
-    )
-    _debug(f"Requeued job {job_type} dedupe_key={dedupe_key}")
+        (list(keys),),
+    ).fetchall()
+    if rows:
+        raise RuntimeError(f"jobs.dedupe_hash collision; not enqueued: {[str(r['k']) for r in rows]}")
 
 
-def claim_next_job(conn: Any, *, allowed_job_types: Optional[set[str]] = None) -> Optional[Job]:
-    now = utcnow_iso()
+JOBS_CHANNEL = "jobs_new"
 
-    where_extra = ""
-    params: list[Any] = [now]
 
-    if allowed_job_types:
-        types = sorted({t for t in allowed_job_types if t})
-        if types:
-            placeholders = ",".join(["?"] * len(types))
-            where_extra = f" AND job_type IN ({placeholders})"
-            params.extend(types)
+def notify_enqueued(conn: Any, job_types: AbstractSet[str]) -> None:
+    """NOTIFY listeners (one message per job type) that runnable jobs were written.
 
-    # Atomic "select + update" with RETURNING to avoid race conditions.
-    # PostgreSQL: add SKIP LOCKED so multiple workers don't pile onto the same row.
-    lock_clause = " FOR UPDATE SKIP LOCKED"
+    Delivered when the enqueuing transaction commits; Postgres folds duplicates.
+    """
+    conn.execute(
+        "SELECT pg_notify(?, t) FROM unnest(?::text[]) AS t",
+        (JOBS_CHANNEL, sorted(job_types)),
+    ).fetchall()
 
+
+def wait_for_job_types(conn: Any, job_types: Optional[JobTypes], timeout_ms: int) -> bool:
+    """Block until a job of one of ``job_types`` (any type if empty) is enqueued, or timeout.
+
+    ``conn`` must be a dedicated connection (connect(dsn, pooled=False)); see
+    db.wait_for_notifies. Returns True if woken by a notification. Polling remains the
+    fallback: jobs whose run_after elapses do not notify.
+    """
+    wanted = normalize_job_types(job_types)
+    deadline = time.monotonic() + max(0, int(timeout_ms)) / 1000.0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        payloads = wait_for_notifies(conn, JOBS_CHANNEL, remaining)
+        if payloads and (not wanted or any(p in wanted for p in payloads)):
+            return True
+
+
+class JobNotifier:
+    """Idle wait for a worker loop that wakes as soon as a matching job is enqueued.
+
+    Holds one dedicated LISTEN connection (opened lazily, reopened after errors) and
+    falls back to a plain sleep if the database is unavailable. Producers need no
+    changes: enqueue_jobs_bulk already NOTIFYs on commit, across processes.
+    Not thread-safe; use one per loop.
+    """
+
+    def __init__(self, db_dsn: str, job_types: Optional[JobTypes] = None) -> None:
+        self._dsn = db_dsn
+        self._job_types = normalize_job_types(job_types)
+        self._cm: Any = None
+        self._conn: Any = None
+
+    def wait(self, timeout_seconds: float) -> bool:
+        """Block up to ``timeout_seconds``; True if woken by a notification."""
+        try:
+            if self._conn is None:
+                self._cm = connect(self._dsn, pooled=False)
+                self._conn = self._cm.__enter__()
+            return wait_for_job_types(self._conn, self._job_types, int(timeout_seconds * 1000))
+        except Exception as e:
+            logger.warning("job notifier unavailable (%s); sleeping instead", e)
+            self.close()
+            time.sleep(timeout_seconds)
+            return False
+
+    def close(self) -> None:
+        cm, self._cm, self._conn = self._cm, None, None
+        if cm is not None:
+            try:
+                cm.__exit__(None, None, None)
+            except Exception:
+                pass
+
+
+JobTypes = Union[Tuple[str, ...], AbstractSet[str]]
+
+
+def normalize_job_types(allowed_job_types: Optional[JobTypes]) -> Tuple[str, ...]:
+    """Sorted, deduped, blank-free tuple of job types (() means "all types").
+
+    Tuples are assumed to be normalized already and are returned unchanged, so workers
+    with a fixed allowlist can normalize once and skip this work on every poll.
+    """
+    if not allowed_job_types:
+        return ()
+    if isinstance(allowed_job_types, tuple):
+        return allowed_job_types
+    return _normalize_job_types_cached(frozenset(allowed_job_types))
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_job_types_cached(types: FrozenSet[str]) -> Tuple[str, ...]:
+    return tuple(sorted(t for t in types if t))
+
+
+def claim_next_job(conn: Any, *, allowed_job_types: Optional[JobTypes] = None) -> Optional[Job]:
+    """Claim the highest-priority runnable pending job (or None).
+
+    Relies on the partial index idx_jobs_claim_ms (created in db._migrate) to read pending jobs already in
+    claim order; without it every poll sorts the whole pending set.
+    """
+    jobs = claim_next_jobs(conn, 1, allowed_job_types=allowed_job_types)
+    return jobs[0] if jobs else None
+
+
+def claim_next_jobs(conn: Any, n: int, *, allowed_job_types: Optional[JobTypes] = None) -> List[Job]:
+    """Claim up to ``n`` runnable pending jobs in one round trip, in claim order.
+
+    Every returned job is marked running in the caller's transaction, so the caller should
+    finish (or roll back) all of them before committing.
+    """
+    return _jobs_from_rows(_claim_rows(conn, n, allowed_job_types))
+
+
+def _claim_rows(conn: Any, n: int, allowed_job_types: Optional[JobTypes]) -> List[Any]:
+    t = time.time()
+    now = iso_from_epoch(int(t))
+    types = normalize_job_types(allowed_job_types)
+    name, sql = _claim_sql(types)
+    return execute_prepared(conn, name, sql, (now, int(t * 1000), *types, max(1, int(n)))).fetchall()
+
+
+def _jobs_from_rows(rows: List[Any]) -> List[Job]:
+    # RETURNING order is unspecified; restore claim order.
+    rows.sort(key=lambda r: (-int(r["priority"] or 0), str(r["created_at"]), int(r["job_id"])))
+    return [_job_from_row(r) for r in rows]
+
+
+@functools.lru_cache(maxsize=64)
+def _claim_sql(types: Tuple[str, ...]) -> Tuple[str, str]:
+    """Build (and cache) the claim statement for one normalized job-types tuple.
+
+    Returns (prepared statement name, sql). The job_type placeholders bind in the tuple's order.
+    """
+    where_extra = ""
+    if types:
+        placeholders = ",".join(["?"] * len(types))
+        where_extra = f" AND job_type IN ({placeholders})"
+
+    # Atomic "select + update" with RETURNING to avoid race conditions. SKIP LOCKED lets
+    # competing workers pass over each other's candidate rows instead of blocking; the row
+    # lock also guarantees the jobs are still pending, so no outer status re-check.
+    # ARRAY(...) pins the locking subquery to a single evaluation.
     sql = f"""
-    WITH next AS (
+    UPDATE jobs
+    SET status='running',
+        updated_at=?
+    WHERE job_id = ANY(ARRAY(
         SELECT job_id
         FROM jobs
         WHERE status='pending'
-          AND (run_after IS NULL OR run_after <= ?)
+          AND (run_after_ms IS NULL OR run_after_ms <= ?)
           {where_extra}
         ORDER BY priority DESC, created_at ASC, job_id ASC
-        LIMIT 1{lock_clause}
-    )
-    UPDATE jobs
-    SET status='running',
-        updated_at=?
-    WHERE job_id = (SELECT job_id FROM next)
-      AND status='pending'
-    RETURNING job_id, job_type, priority, dedupe_key, payload_json, attempts, max_attempts;
+        LIMIT ?
+        FOR UPDATE SKIP LOCKED
+    ))
+    RETURNING job_id, job_type, priority, dedupe_key, payload_json::text AS payload_json, attempts, max_attempts, created_at;
     """
+    return f"jobs_claim_{zlib.crc32(sql.encode('utf-8')):08x}", sql
 
-    params2 = params + [now]
-    row = conn.execute(sql, tuple(params2)).fetchone()
-
-    if row is None:
-        return None
 
-    payload_json = row.get("payload_json") if row is not None else None
-    payload = json.loads(payload_json) if payload_json else {}
+def _job_from_row(row: Any) -> Job:
     return Job(
         job_id=int(row["job_id"]),
         job_type=str(row["job_type"]),
         status="running",
         priority=int(row["priority"] or 0),
         dedupe_key=str(row["dedupe_key"]),
-        payload=payload,
+        payload_raw=str(row.get("payload_json") or ""),
         attempts=int(row["attempts"] or 0),
         max_attempts=int(row["max_attempts"] or 3),
     )
 
 
-def mark_job_success(conn: Any, job_id: int) -> None:
-    conn.execute(
-        "UPDATE jobs SET status='success', updated_at=? WHERE job_id=?",
+def _trunc(s: Any, n: int = 5000) -> str:
+    # Slice strings directly; only non-str values (e.g. exceptions) go through str().
+    return s[:n] if isinstance(s, str) else str(s)[:n]
+
+
+def _now_and_after(seconds: int) -> Tuple[str, str, int]:
+    # One clock read for a state transition: (now ISO, run_after ISO, run_after epoch ms).
+    sec = int(time.time())
+    after = sec + int(seconds)
+    return iso_from_epoch(sec), iso_from_epoch(after), after * 1000
+
+
+def _iso_to_ms(iso: str) -> int:
+    dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+# Job state transitions commit synchronously, like the handler writes they share a
+# transaction with. The jobs table stays logged (not UNLOGGED): Postgres truncates unlogged
+# tables after a crash, which would silently discard every pending job.
+
+
+def mark_job_success(conn: Any, job_id: int) -> Optional[Tuple[str, int]]:
+    """Mark a job successful; returns (job_type, priority), or None if it does not exist."""
+    row = execute_prepared(
+        conn,
+        "jobs_mark_success",
+        "UPDATE jobs SET status='success', updated_at=? WHERE job_id=? RETURNING job_type, priority",
         (utcnow_iso(), int(job_id)),
-    )
+    ).fetchone()
+    if row is None:
+        return None
+    return str(row["job_type"]), int(row["priority"] or 0)
 
 
 def mark_job_deferred(conn: Any, job_id: int, reason: str, *, retry_after_seconds: int = 30) -> None:
     """Return a running job back to pending without consuming an attempt."""
-    now = utcnow_iso()
-    run_after_dt = datetime.now(timezone.utc) + timedelta(seconds=int(retry_after_seconds))
-    run_after = run_after_dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
-    conn.execute(
+    now, run_after, run_after_ms = _now_and_after(retry_after_seconds)
+    execute_prepared(
+        conn,
+        "jobs_mark_deferred",
         """
         UPDATE jobs
         SET status='pending',
             last_error=?,
             updated_at=?,
-            run_after=?
+            run_after=?,
+            run_after_ms=?
         WHERE job_id=?
         """,
-        (str(reason)[:5000], now, run_after, int(job_id)),
+        (_trunc(reason), now, run_after, run_after_ms, int(job_id)),
     )
 
 
-def mark_job_error(conn: Any, job_id: int, err: str, *, retry_after_seconds: int = 60) -> None:
-    """Mark error; retry if attempts < max_attempts."""
-    now = utcnow_iso()
-
-    row = conn.execute("SELECT attempts, max_attempts FROM jobs WHERE job_id=?", (int(job_id),)).fetchone()
-    if row is None:
-        return
-
-    attempts = int(row["attempts"]) + 1
-    max_attempts = int(row["max_attempts"])
+def mark_job_error(conn: Any, job_id: int, err: str, *, retry_after_seconds: int = 60) -> Optional[str]:
+    """Mark error; retry if attempts < max_attempts.
 
-    if attempts >= max_attempts:
-        conn.execute(
-            """
-            UPDATE jobs
-            SET status='error', attempts=?, last_error=?, updated_at=?
-            WHERE job_id=?
-            """,
-            (attempts, str(err)[:5000], now, int(job_id)),
-        )
-        return
+    Single atomic UPDATE; returns the resulting status ('error' or 'pending'), or None if
+    the job does not exist.
+    """
+    now, run_after, run_after_ms = _now_and_after(retry_after_seconds)
 
-    # Backoff by pushing run_after forward (simple fixed backoff)
-    run_after_dt = datetime.now(timezone.utc) + timedelta(seconds=int(retry_after_seconds))
-    run_after = run_after_dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
-    conn.execute(
+    # Backoff by pushing run_after forward (simple fixed backoff); terminal errors keep theirs.
+    row = execute_prepared(
+        conn,
+        "jobs_mark_error",
         """
         UPDATE jobs
-        SET status='pending', attempts=?, last_error=?, updated_at=?, run_after=?
-        WHERE job_id=?
+        SET attempts = attempts + 1,
+            last_error = ?,
+            updated_at = ?,
+            status = CASE WHEN attempts + 1 >= max_attempts THEN 'error' ELSE 'pending' END,
+            run_after = CASE WHEN attempts + 1 >= max_attempts THEN run_after ELSE ? END,
+            run_after_ms = CASE WHEN attempts + 1 >= max_attempts THEN run_after_ms ELSE ? END
+        WHERE job_id = ?
+        RETURNING status
         """,
-        (attempts, str(err)[:5000], now, run_after, int(job_id)),
-    )
+        (_trunc(err), now, run_after, run_after_ms, int(job_id)),
+    ).fetchone()
+    return str(row["status"]) if row is not None else None
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import multiprocessing.connection
+import os
+import threading
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Set
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, Optional, Tuple
 
 from insider_platform.ai.judge import run_ai_for_event
 from insider_platform.compute.aggregate import aggregate_accession
@@ -15,11 +17,24 @@ from insider_platform.compute.stats import compute_stats_for_owner_issuer
 from insider_platform.compute.trend import compute_trend_for_event
 from insider_platform.config import Config
 from insider_platform.db import connect, upsert_app_config
-from insider_platform.jobs.queue import claim_next_job, enqueue_job, mark_job_deferred, mark_job_error, mark_job_success
+from insider_platform.jobs.queue import (
+    EnqueueSpec,
+    Job,
+    JobNotifier,
+    claim_next_jobs,
+    enqueue_job,
+    enqueue_jobs_bulk,
+    mark_job_deferred,
+    mark_job_error,
+    mark_job_success,
+    normalize_job_types,
+)
 from insider_platform.models import EventKey, OwnerIssuerKey
 from insider_platform.sec.backfill import discover_form4_accessions_for_issuer
 from insider_platform.sec.ingest import fetch_accession_document, parse_accession_document
 from insider_platform.sec.poller import poll_sec_current_form4_and_enqueue
+from insider_platform.util import jsonutil
+from insider_platform.util.time import iso_from_epoch, utcnow_iso
 
 
 def _debug(msg: str) -> None:
@@ -38,8 +53,9 @@ class JobDeferred(Exception):
 
 
 
-# Job type groupings (useful for running dedicated workers)
-API_JOB_TYPES: Set[str] = {
+# Job type groupings (useful for running dedicated workers). Frozen so they hash straight
+# into the claim-SQL cache (queue.normalize_job_types) and can't be mutated by callers.
+API_JOB_TYPES: FrozenSet[str] = frozenset({
     # SEC / network
     "FETCH_ACCESSION_DOCS",
     "INGEST_ACCESSION",  # backward-compatible alias that fetches + enqueues parse
@@ -50,9 +66,9 @@ API_JOB_TYPES: Set[str] = {
     "BACKFILL_DISCOVER_ISSUER",
     # enqueue batch itself is DB-only, but keeping it here helps keep backfills single-role
     "BACKFILL_ENQUEUE_BATCH",
-}
+})
 
-COMPUTE_JOB_TYPES: Set[str] = {
+COMPUTE_JOB_TYPES: FrozenSet[str] = frozenset({
     "PARSE_ACCESSION_DOCS",
     "AGGREGATE_ACCESSION",
     "COMPUTE_TREND_FOR_EVENT",
@@ -61,15 +77,27 @@ COMPUTE_JOB_TYPES: Set[str] = {
     "COMPUTE_CLUSTERS_FOR_TICKER",
     "RUN_AI_FOR_EVENT",
     "REPARSE_TICKER",
-}
+})
+
+# Job types that only touch the database, so several can share one claim + transaction.
+# Anything that calls SEC, EODHD or Gemini is claimed alone and commits on its own, so a
+# slow request never holds other jobs' locks or results.
+_BATCHABLE_JOB_TYPES: FrozenSet[str] = COMPUTE_JOB_TYPES - {"RUN_AI_FOR_EVENT"}
+
+# Priorities of the per-event jobs (higher runs first).
+_TREND_PRIORITY = 40
+_OUTCOMES_PRIORITY = 50
+_AI_PRIORITY = 200
 
 
 def run_worker_forever(
     db_path: str,
     cfg: Config,
     *,
-    allowed_job_types: Optional[Set[str]] = None,
+    allowed_job_types: Optional[AbstractSet[str]] = None,
     enable_poller: Optional[bool] = None,
+    concurrency: int = 1,
+    processes: int = 1,
 ) -> None:
     """Run a worker loop.
 
@@ -78,8 +106,45 @@ def run_worker_forever(
     enable_poller defaults to:
       - True if allowed_job_types is None or includes FETCH_ACCESSION_DOCS/INGEST_ACCESSION (API worker)
       - False otherwise
+
+    concurrency > 1 runs that many claim loops in threads, each on its own pooled connection
+    and transaction (useful for network-bound jobs; SEC requests stay globally throttled).
+    Only the first loop runs the poller.
+
+    processes > 1 additionally starts processes - 1 child worker processes (same job types,
+    no poller) so CPU-bound compute jobs run on several cores; each child has its own
+    connection pool and claims independently (SKIP LOCKED keeps them apart). The count is
+    capped at the CPU count, and children that exit are restarted.
     """
-    _debug(f"Worker starting; db={db_path} allowed_job_types={sorted(allowed_job_types) if allowed_job_types else 'ALL'}")
+    concurrency = max(1, int(concurrency))
+    processes = max(1, min(int(processes), os.cpu_count() or 1))
+    _debug(
+        f"Worker starting; db={db_path} allowed_job_types={sorted(allowed_job_types) if allowed_job_types else 'ALL'}"
+        f" concurrency={concurrency} processes={processes}"
+    )
+
+    if processes > 1:
+        ctx = multiprocessing.get_context("spawn")
+
+        def start_child(i: int) -> Any:
+            p = ctx.Process(
+                target=run_worker_forever,
+                args=(db_path, cfg),
+                kwargs={
+                    "allowed_job_types": frozenset(allowed_job_types) if allowed_job_types else None,
+                    "enable_poller": False,
+                    "concurrency": concurrency,
+                },
+                name=f"worker-proc-{i}",
+                daemon=True,
+            )
+            p.start()
+            return p
+
+        children = {i: start_child(i) for i in range(1, processes)}
+        threading.Thread(
+            target=_supervise_children, args=(children, start_child), name="worker-supervisor", daemon=True
+        ).start()
 
     if enable_poller is None:
         if allowed_job_types is None:
@@ -87,54 +152,121 @@ def run_worker_forever(
         else:
             enable_poller = ("FETCH_ACCESSION_DOCS" in allowed_job_types) or ("INGEST_ACCESSION" in allowed_job_types)
 
-    next_poll_mono: float = time.monotonic()
+    claim_types = normalize_job_types(allowed_job_types)
+    unknown = [t for t in claim_types if t not in _DISPATCH]
+    if unknown:
+        raise ValueError(f"Unknown job types in allowed_job_types: {unknown}")
+    for i in range(1, concurrency):
+        threading.Thread(
+            target=_worker_loop,
+            args=(db_path, cfg, claim_types, False),
+            name=f"worker-{i}",
+            daemon=True,
+        ).start()
+    _worker_loop(db_path, cfg, claim_types, bool(enable_poller))
+
+
+# Pause before restarting a child worker process that exited (keeps a crash loop slow).
+_CHILD_RESTART_DELAY_SECONDS = 5.0
 
+
+def _supervise_children(children: Dict[int, Any], start_child: Callable[[int], Any]) -> None:
+    # Block until any child exits, then restart it under the same slot number.
     while True:
-        with connect(db_path) as conn:
-            # Optional: periodic SEC "current" Form 4 poller.
-            if enable_poller and cfg.ENABLE_FORM4_POLLER and time.monotonic() >= next_poll_mono:
-                try:
-                    res = poll_sec_current_form4_and_enqueue(conn, cfg)
-                    _debug(
-                        f"[poller] tracked={res.get('tracked_issuers')} seen={res.get('feed_entries')} enqueued={res.get('enqueued')}"
-                    )
-                except Exception as e:
-                    _debug(f"[poller] error: {e}")
-                finally:
-                    next_poll_mono = time.monotonic() + max(5, int(cfg.FORM4_POLLER_INTERVAL_SECONDS))
-
-            job = claim_next_job(conn, allowed_job_types=allowed_job_types)
-            if job is None:
-                # No job; sleep a bit
-                pass
-            else:
-                _debug(f"Running job id={job.job_id} type={job.job_type} attempts={job.attempts}/{job.max_attempts}")
-                try:
-                    _run_job(conn, cfg, job.job_type, job.payload)
-                    mark_job_success(conn, job.job_id)
-                    _debug(f"Job success id={job.job_id} type={job.job_type}")
-                except JobDeferred as e:
-                    _debug(f"Job deferred id={job.job_id} type={job.job_type}: {e.reason}")
-                    # Keep last_error for observability, but do NOT consume an attempt.
-                    mark_job_deferred(conn, job.job_id, e.reason, retry_after_seconds=e.retry_after_seconds)
-                except Exception as e:
-                    _debug(f"Job error id={job.job_id} type={job.job_type}: {e}")
-                    # For backfill jobs, persist error on the backfill row so progress is visible.
-                    _maybe_mark_backfill_error(conn, job.job_type, job.payload, str(e))
-                    try:
-                        conn.execute("ROLLBACK")  # undo partial work before recording error
-                    except Exception:
-                        pass
-                    mark_job_error(conn, job.job_id, str(e), retry_after_seconds=60)
+        multiprocessing.connection.wait([p.sentinel for p in children.values()])
+        for i, p in list(children.items()):
+            if p.is_alive():
+                continue
+            _debug(f"{p.name} exited with code {p.exitcode}; restarting in {_CHILD_RESTART_DELAY_SECONDS:g}s")
+            time.sleep(_CHILD_RESTART_DELAY_SECONDS)
+            children[i] = start_child(i)
+
+
+def _worker_loop(db_path: str, cfg: Config, claim_types: Tuple[str, ...], enable_poller: bool) -> None:
+    poll_interval_ns = max(5, int(cfg.FORM4_POLLER_INTERVAL_SECONDS)) * 1_000_000_000
+    poller_on = enable_poller and cfg.ENABLE_FORM4_POLLER
+    next_poll_ns = time.monotonic_ns()
+    batch_size = max(1, int(cfg.WORKER_CLAIM_BATCH_SIZE))
+    batch_types = normalize_job_types(
+        [t for t in claim_types if t in _BATCHABLE_JOB_TYPES] if claim_types else _BATCHABLE_JOB_TYPES
+    )
+    notifier = JobNotifier(db_path, claim_types)
 
-        time.sleep(cfg.WORKER_POLL_SECONDS)
+    while True:
+        try:
+            with connect(db_path) as conn:
+                # Optional: periodic SEC "current" Form 4 poller.
+                if poller_on and time.monotonic_ns() >= next_poll_ns:
+                    try:
+                        res = poll_sec_current_form4_and_enqueue(conn, cfg)
+                        _debug(
+                            f"[poller] tracked={res.get('tracked_issuers')} seen={res.get('feed_entries')} enqueued={res.get('enqueued')}"
+                        )
+                    except Exception as e:
+                        _debug(f"[poller] error: {e}")
+                    finally:
+                        next_poll_ns = time.monotonic_ns() + poll_interval_ns
+
+                # Claim the next job; if it is DB-only, top up the batch with more DB-only
+                # jobs and run them all in this one transaction. Each job gets its own
+                # savepoint so a failure only rolls back that job's work.
+                jobs = claim_next_jobs(conn, 1, allowed_job_types=claim_types)
+                if jobs and batch_size > 1 and batch_types and jobs[0].job_type in _BATCHABLE_JOB_TYPES:
+                    jobs += claim_next_jobs(conn, batch_size - 1, allowed_job_types=batch_types)
+                for job in jobs:
+                    _run_claimed_job(conn, cfg, job)
+        except Exception as e:
+            if threading.current_thread() is threading.main_thread():
+                raise
+            # Keep background loops alive across transient DB errors.
+            _debug(f"[{threading.current_thread().name}] loop error: {e}")
+            jobs = []
+
+        if not jobs:
+            # No job; wait for an enqueue NOTIFY (polling every WORKER_POLL_SECONDS still
+            # picks up jobs whose run_after elapses).
+            notifier.wait(cfg.WORKER_POLL_SECONDS)
+
+
+def _run_claimed_job(conn: Any, cfg: Config, job: Job) -> None:
+    _debug(f"Running job id={job.job_id} type={job.job_type} attempts={job.attempts}/{job.max_attempts}")
+    conn.execute("SAVEPOINT job")
+    try:
+        _run_job(conn, cfg, job.job_type, job.payload)
+        conn.execute("RELEASE SAVEPOINT job")
+        mark_job_success(conn, job.job_id)
+        _debug(f"Job success id={job.job_id} type={job.job_type}")
+    except JobDeferred as e:
+        _debug(f"Job deferred id={job.job_id} type={job.job_type}: {e.reason}")
+        # Keep the prerequisite enqueues; keep last_error for observability, but do NOT
+        # consume an attempt.
+        conn.execute("RELEASE SAVEPOINT job")
+        mark_job_deferred(conn, job.job_id, e.reason, retry_after_seconds=e.retry_after_seconds)
+    except Exception as e:
+        _debug(f"Job error id={job.job_id} type={job.job_type}: {e}")
+        conn.execute("ROLLBACK TO SAVEPOINT job")  # undo partial work before recording error
+        conn.execute("RELEASE SAVEPOINT job")
+        # For backfill jobs, persist error on the backfill row so progress is visible.
+        _maybe_mark_backfill_error(conn, job.job_type, job.payload, str(e))
+        mark_job_error(conn, job.job_id, str(e), retry_after_seconds=60)
+
+
+def _cik10(v: Any) -> str:
+    """10-digit zero-padded CIK (same result as str(v).zfill(10), minus the copies)."""
+    if type(v) is int:
+        return f"{v:010d}"
+    s = v if type(v) is str else str(v)
+    return s if len(s) >= 10 else s.zfill(10)
 
 
 def _iso_after_seconds(seconds: int) -> str:
-    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).isoformat().replace("+00:00", "Z")
+    if not seconds:
+        return utcnow_iso()
+    return iso_from_epoch(int(time.time()) + int(seconds))
 
 
 def _maybe_mark_backfill_error(conn: Any, job_type: str, payload: Dict[str, Any], err: str) -> None:
+    now_iso = utcnow_iso()
     try:
         if job_type in ("FETCH_ACCESSION_DOCS", "INGEST_ACCESSION"):
             issuer_cik = str(payload.get("issuer_cik_hint") or payload.get("issuer_cik") or "").strip()
@@ -146,7 +278,7 @@ def _maybe_mark_backfill_error(conn: Any, job_type: str, payload: Dict[str, Any]
                     SET status='error', updated_at=?, last_error=?
                     WHERE issuer_cik=? AND accession_number=?
                     """,
-                    (_iso_after_seconds(0), err[:1000], issuer_cik.zfill(10), acc),
+                    (now_iso, err[:1000], _cik10(issuer_cik), acc),
                 )
         if job_type == "PARSE_ACCESSION_DOCS":
             acc = str(payload.get("accession_number") or "").strip()
@@ -156,72 +288,72 @@ def _maybe_mark_backfill_error(conn: Any, job_type: str, payload: Dict[str, Any]
                     (acc,),
                 ).fetchone()
                 if doc is not None and doc["issuer_cik"]:
-                    issuer_cik = str(doc["issuer_cik"]).zfill(10)
+                    issuer_cik = _cik10(doc["issuer_cik"])
                     conn.execute(
                         """
                         UPDATE backfill_queue
                         SET status='error', updated_at=?, last_error=?
                         WHERE issuer_cik=? AND accession_number=?
                         """,
-                        (_iso_after_seconds(0), err[:1000], issuer_cik, acc),
+                        (now_iso, err[:1000], issuer_cik, acc),
                     )
     except Exception:
         # Never let bookkeeping failures break the worker
         return
 
 
-def _run_job(conn: Any, cfg: Config, job_type: str, payload: Dict[str, Any]) -> None:
-    # -------------------------------------------------------------------------
-    # INGESTION: split into fetch (API-bound) + parse (compute-bound)
-    # -------------------------------------------------------------------------
-    if job_type in ("FETCH_ACCESSION_DOCS", "INGEST_ACCESSION"):
-        accession = str(payload["accession_number"]).strip()
-        issuer_cik_hint = str(payload.get("issuer_cik_hint") or payload.get("issuer_cik") or "").strip() or None
-        filing_date = payload.get("filing_date")
-        form_type = payload.get("form_type")
-        force = bool(payload.get("force") or False)
-
-        # IMPORTANT: We only generate AI for poller-discovered (new) filings. This flag is
-        # propagated through the ingest pipeline so backfills/reparses do not trigger AI calls.
-        ai_requested = bool(payload.get("ai_requested") or False)
-        ingest_source = str(payload.get("ingest_source") or "").strip() or ("poller" if ai_requested else "manual")
-
-        fetch_accession_document(
-            conn,
-            cfg,
-            accession,
-            issuer_cik_hint=issuer_cik_hint,
-            filing_date_hint=str(filing_date).strip() if filing_date else None,
-            form_type_hint=str(form_type).strip() if form_type else None,
-            force=force,
-        )
-
-        # Enqueue parse (versioned)
-        enqueue_job(
-            conn,
-            job_type="PARSE_ACCESSION_DOCS",
-            dedupe_key=f"PARSE|{accession}|{cfg.CURRENT_PARSE_VERSION}",
-            payload={
-                "accession_number": accession,
-                "ingest_source": ingest_source,
-                "ai_requested": ai_requested,
-            },
-            priority=20,
-            requeue_if_exists=True,
-            # If a job is already pending, allow a "new filing" promotion to update payload/priority.
-            promote_if_pending=True,
-        )
-        return
-
-    if job_type == "PARSE_ACCESSION_DOCS":
-        accession = str(payload["accession_number"]).strip()
-        ai_requested = bool(payload.get("ai_requested") or False)
-        ingest_source = str(payload.get("ingest_source") or "").strip() or ("poller" if ai_requested else "manual")
-        res = parse_accession_document(conn, cfg, accession)
-
-        # Enqueue aggregation next (deterministic)
-        enqueue_job(
-            conn,
+# -------------------------------------------------------------------------
+# INGESTION: split into fetch (API-bound) + parse (compute-bound)
+# -------------------------------------------------------------------------
+def _handle_fetch_accession_docs(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    accession = str(payload["accession_number"]).strip()
+    issuer_cik_hint = str(payload.get("issuer_cik_hint") or payload.get("issuer_cik") or "").strip() or None
+    filing_date = payload.get("filing_date")
+    form_type = payload.get("form_type")
+    force = bool(payload.get("force") or False)
+
+    # IMPORTANT: We only generate AI for poller-discovered (new) filings. This flag is
+    # propagated through the ingest pipeline so backfills/reparses do not trigger AI calls.
+    ai_requested = bool(payload.get("ai_requested") or False)
+    ingest_source = str(payload.get("ingest_source") or "").strip() or ("poller" if ai_requested else "manual")
+
+    fetch_accession_document(
+        conn,
+        cfg,
+        accession,
+        issuer_cik_hint=issuer_cik_hint,
+        filing_date_hint=str(filing_date).strip() if filing_date else None,
+        form_type_hint=str(form_type).strip() if form_type else None,
+        force=force,
+    )
+
+    # Enqueue parse (versioned)
+    enqueue_job(
+        conn,
+        job_type="PARSE_ACCESSION_DOCS",
+        dedupe_key=f"PARSE|{accession}|{cfg.CURRENT_PARSE_VERSION}",
+        payload={
+            "accession_number": accession,
+            "ingest_source": ingest_source,
+            "ai_requested": ai_requested,
+        },
+        priority=20,
+        requeue_if_exists=True,
+        # If a job is already pending, allow a "new filing" promotion to update payload/priority.
+        promote_if_pending=True,
+    )
+
+
+def _handle_parse_accession_docs(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    accession = str(payload["accession_number"]).strip()
+    ai_requested = bool(payload.get("ai_requested") or False)
+    ingest_source = str(payload.get("ingest_source") or "").strip() or ("poller" if ai_requested else "manual")
+    res = parse_accession_document(conn, cfg, accession)
+
+    # Enqueue aggregation next (deterministic), plus price fetch + market cap fetch +
+    # cluster compute (ticker known after parse), in one bulk write.
+    specs = [
+        EnqueueSpec(
             job_type="AGGREGATE_ACCESSION",
             dedupe_key=f"AGG|{accession}|{cfg.CURRENT_PARSE_VERSION}",
             payload={
@@ -233,106 +365,105 @@ def _run_job(conn: Any, cfg: Config, job_type: str, payload: Dict[str, Any]) ->
             requeue_if_exists=True,
             promote_if_pending=True,
         )
-
-        # Also enqueue price fetch + market cap fetch + cluster compute (ticker known after parse)
-        if res.issuer_cik:
-            enqueue_job(
-                conn,
+    ]
+    if res.issuer_cik:
+        specs.append(
+            EnqueueSpec(
                 job_type="FETCH_EOD_PRICES_FOR_ISSUER",
                 dedupe_key=f"PRICES|{res.issuer_cik}",
                 payload={"issuer_cik": res.issuer_cik},
                 priority=10,
                 requeue_if_exists=True,
             )
-        if res.ticker:
-            enqueue_job(
-                conn,
+        )
+    if res.ticker:
+        specs += [
+            EnqueueSpec(
                 job_type="FETCH_MARKET_CAP_FOR_TICKER",
                 dedupe_key=f"MCAP|{res.ticker}",
                 payload={"ticker": res.ticker},
                 priority=15,
                 requeue_if_exists=True,
-            )
-            enqueue_job(
-                conn,
+            ),
+            EnqueueSpec(
                 job_type="FETCH_NEWS_FOR_TICKER",
                 dedupe_key=f"NEWS|{res.ticker}",
                 payload={"ticker": res.ticker},
                 priority=12,
                 requeue_if_exists=True,
-            )
-            enqueue_job(
-                conn,
+            ),
+            EnqueueSpec(
                 job_type="COMPUTE_CLUSTERS_FOR_TICKER",
                 dedupe_key=f"CLUSTERS|{res.ticker}|{cfg.CURRENT_CLUSTER_VERSION}",
                 payload={"ticker": res.ticker},
                 priority=30,
                 requeue_if_exists=True,
-            )
-        return
-
-    # -------------------------------------------------------------------------
-    # BACKFILL
-    # -------------------------------------------------------------------------
-    if job_type == "BACKFILL_DISCOVER_ISSUER":
-        issuer_cik = str(payload["issuer_cik"]).zfill(10)
-        start_year = int(payload.get("start_year") or getattr(cfg, "BACKFILL_START_YEAR", 2006))
-        discovered = discover_form4_accessions_for_issuer(
-            conn,
-            cfg,
-            issuer_cik=issuer_cik,
-            start_year=start_year,
-        )
-        _debug(f"Backfill discover issuer={issuer_cik} start_year={start_year} inserted={discovered}")
-
-        batch_size = int(payload.get("batch_size") or getattr(cfg, "BACKFILL_BATCH_SIZE", 50))
-
-        enqueue_job(
-            conn,
-            job_type="BACKFILL_ENQUEUE_BATCH",
-            dedupe_key=f"BACKFILL_BATCH|{issuer_cik}|{start_year}|{cfg.CURRENT_PARSE_VERSION}",
-            payload={"issuer_cik": issuer_cik, "start_year": start_year, "batch_size": batch_size},
-            priority=5,
-            requeue_if_exists=True,
-        )
-        return
-
-    if job_type == "BACKFILL_ENQUEUE_BATCH":
-        issuer_cik = str(payload["issuer_cik"]).zfill(10)
-        start_year = int(payload.get("start_year") or getattr(cfg, "BACKFILL_START_YEAR", 2006))
-        batch_size = int(payload.get("batch_size") or getattr(cfg, "BACKFILL_BATCH_SIZE", 50))
-
-        rows = conn.execute(
-            """
-            SELECT accession_number, filing_date, form_type
+            ),
+        ]
+    enqueue_jobs_bulk(conn, specs)
+
+
+# -------------------------------------------------------------------------
+# BACKFILL
+# -------------------------------------------------------------------------
+def _handle_backfill_discover_issuer(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    issuer_cik = _cik10(payload["issuer_cik"])
+    start_year = int(payload.get("start_year") or getattr(cfg, "BACKFILL_START_YEAR", 2006))
+    discovered = discover_form4_accessions_for_issuer(
+        conn,
+        cfg,
+        issuer_cik=issuer_cik,
+        start_year=start_year,
+    )
+    _debug(f"Backfill discover issuer={issuer_cik} start_year={start_year} inserted={discovered}")
+
+    batch_size = int(payload.get("batch_size") or getattr(cfg, "BACKFILL_BATCH_SIZE", 50))
+
+    enqueue_job(
+        conn,
+        job_type="BACKFILL_ENQUEUE_BATCH",
+        dedupe_key=f"BACKFILL_BATCH|{issuer_cik}|{start_year}|{cfg.CURRENT_PARSE_VERSION}",
+        payload={"issuer_cik": issuer_cik, "start_year": start_year, "batch_size": batch_size},
+        priority=5,
+        requeue_if_exists=True,
+    )
+
+
+def _handle_backfill_enqueue_batch(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    issuer_cik = _cik10(payload["issuer_cik"])
+    start_year = int(payload.get("start_year") or getattr(cfg, "BACKFILL_START_YEAR", 2006))
+    batch_size = int(payload.get("batch_size") or getattr(cfg, "BACKFILL_BATCH_SIZE", 50))
+
+    # Pick the next batch and mark it queued in one statement; the FETCH jobs below are
+    # written in the same transaction, so the two can't drift apart.
+    rows = conn.execute(
+        """
+        UPDATE backfill_queue
+        SET status='queued', updated_at=?
+        WHERE issuer_cik=? AND accession_number IN (
+            SELECT accession_number
             FROM backfill_queue
             WHERE issuer_cik=? AND status='pending'
             ORDER BY filing_date ASC
             LIMIT ?
-            """,
-            (issuer_cik, batch_size),
-        ).fetchall()
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING accession_number, filing_date, form_type
+        """,
+        (utcnow_iso(), issuer_cik, issuer_cik, batch_size),
+    ).fetchall()
 
-        if not rows:
-            _debug(f"Backfill batch complete issuer={issuer_cik}")
-            return
-
-        now = _iso_after_seconds(0)
-
-        for r in rows:
-            acc = str(r["accession_number"]).strip()
-            # Mark queued (best-effort; idempotent)
-            conn.execute(
-                """
-                UPDATE backfill_queue
-                SET status='queued', updated_at=?
-                WHERE issuer_cik=? AND accession_number=? AND status='pending'
-                """,
-                (now, issuer_cik, acc),
-            )
+    if not rows:
+        _debug(f"Backfill batch complete issuer={issuer_cik}")
+        return
+
+    rows.sort(key=lambda r: str(r["filing_date"] or ""))
+    accs = [str(r["accession_number"]).strip() for r in rows]
 
-            enqueue_job(
-                conn,
+    enqueue_jobs_bulk(
+        conn,
+        [
+            EnqueueSpec(
                 job_type="FETCH_ACCESSION_DOCS",
                 dedupe_key=f"FETCH|{acc}",
                 payload={
@@ -346,286 +477,328 @@ def _run_job(conn: Any, cfg: Config, job_type: str, payload: Dict[str, Any]) ->
                 priority=5,
                 requeue_if_exists=True,
             )
+            for acc, r in zip(accs, rows)
+        ],
+    )
 
-        # If more remain, enqueue another batch job shortly.
-        remaining = conn.execute(
-            "SELECT 1 FROM backfill_queue WHERE issuer_cik=? AND status='pending' LIMIT 1",
-            (issuer_cik,),
-        ).fetchone()
-        if remaining:
-            enqueue_job(
-                conn,
-                job_type="BACKFILL_ENQUEUE_BATCH",
-                dedupe_key=f"BACKFILL_BATCH|{issuer_cik}|{start_year}|{cfg.CURRENT_PARSE_VERSION}",
-                payload={"issuer_cik": issuer_cik, "start_year": start_year, "batch_size": batch_size},
-                priority=5,
-                run_after=_iso_after_seconds(1),
-                requeue_if_exists=True,
-            )
-        return
+    # If more remain, enqueue another batch job shortly.
+    remaining = conn.execute(
+        "SELECT 1 FROM backfill_queue WHERE issuer_cik=? AND status='pending' LIMIT 1",
+        (issuer_cik,),
+    ).fetchone()
+    if remaining:
+        enqueue_job(
+            conn,
+            job_type="BACKFILL_ENQUEUE_BATCH",
+            dedupe_key=f"BACKFILL_BATCH|{issuer_cik}|{start_year}|{cfg.CURRENT_PARSE_VERSION}",
+            payload={"issuer_cik": issuer_cik, "start_year": start_year, "batch_size": batch_size},
+            priority=5,
+            run_after=_iso_after_seconds(1),
+            requeue_if_exists=True,
+        )
 
-    # -------------------------------------------------------------------------
-    # AGGREGATION + COMPUTE
-    # -------------------------------------------------------------------------
-    if job_type == "AGGREGATE_ACCESSION":
-        accession = str(payload["accession_number"]).strip()
-        ai_requested = bool(payload.get("ai_requested") or False)
-        ingest_source = str(payload.get("ingest_source") or "").strip() or ("poller" if ai_requested else "manual")
-
-        event_keys = aggregate_accession(conn, cfg, accession)
-
-        # For each event, compute trend + outcomes.
-        # AI is *only* enqueued for poller-discovered (new) filings to keep AI API usage bounded.
-        for ek in event_keys:
-            enqueue_job(
-                conn,
+
+# -------------------------------------------------------------------------
+# AGGREGATION + COMPUTE
+# -------------------------------------------------------------------------
+def _handle_aggregate_accession(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    accession = str(payload["accession_number"]).strip()
+    ai_requested = bool(payload.get("ai_requested") or False)
+    ingest_source = str(payload.get("ingest_source") or "").strip() or ("poller" if ai_requested else "manual")
+
+    event_keys = aggregate_accession(conn, cfg, accession)
+
+    # For each event, compute trend + outcomes (one bulk write for all events).
+    # AI is *only* enqueued for poller-discovered (new) filings to keep AI API usage bounded.
+    trend_v = cfg.CURRENT_TREND_VERSION
+    out_v = cfg.CURRENT_OUTCOMES_VERSION
+    prompt_v = cfg.PROMPT_VERSION
+    trend_specs = []
+    outcomes_specs = []
+    ai_specs = []
+    for ek in event_keys:
+        key = f"{ek.issuer_cik}|{ek.owner_key}|{ek.accession_number}"
+        ek_payload = {
+            "issuer_cik": ek.issuer_cik,
+            "owner_key": ek.owner_key,
+            "accession_number": ek.accession_number,
+        }
+        ek_payload_json = jsonutil.dumps(ek_payload)
+        trend_specs.append(
+            EnqueueSpec(
                 job_type="COMPUTE_TREND_FOR_EVENT",
-                dedupe_key=f"TREND|{ek.issuer_cik}|{ek.owner_key}|{ek.accession_number}|{cfg.CURRENT_TREND_VERSION}",
-                payload={
-                    "issuer_cik": ek.issuer_cik,
-                    "owner_key": ek.owner_key,
-                    "accession_number": ek.accession_number,
-                },
-                priority=40,
+                dedupe_key=f"TREND|{key}|{trend_v}",
+                payload=ek_payload,
+                payload_json=ek_payload_json,
+                priority=_TREND_PRIORITY,
                 requeue_if_exists=True,
             )
-
-            enqueue_job(
-                conn,
+        )
+        outcomes_specs.append(
+            EnqueueSpec(
                 job_type="COMPUTE_OUTCOMES_FOR_EVENT",
-                dedupe_key=f"OUT|{ek.issuer_cik}|{ek.owner_key}|{ek.accession_number}|{cfg.CURRENT_OUTCOMES_VERSION}",
-                payload={
-                    "issuer_cik": ek.issuer_cik,
-                    "owner_key": ek.owner_key,
-                    "accession_number": ek.accession_number,
-                },
-                priority=50,
+                dedupe_key=f"OUT|{key}|{out_v}",
+                payload=ek_payload,
+                payload_json=ek_payload_json,
+                priority=_OUTCOMES_PRIORITY,
                 requeue_if_exists=True,
             )
-
-            if ai_requested:
-                enqueue_job(
-                    conn,
+        )
+        if ai_requested:
+            ai_specs.append(
+                EnqueueSpec(
                     job_type="RUN_AI_FOR_EVENT",
-                    dedupe_key=f"AI|{ek.issuer_cik}|{ek.owner_key}|{ek.accession_number}|{cfg.PROMPT_VERSION}",
-                    payload={
-                        "issuer_cik": ek.issuer_cik,
-                        "owner_key": ek.owner_key,
-                        "accession_number": ek.accession_number,
-                        "ingest_source": ingest_source,
-                        "ai_requested": True,
-                    },
-                    priority=200,
+                    dedupe_key=f"AI|{key}|{prompt_v}",
+                    payload={**ek_payload, "ingest_source": ingest_source, "ai_requested": True},
+                    priority=_AI_PRIORITY,
                     max_attempts=10,
                     # Do NOT requeue by default; use the admin endpoint to regenerate AI explicitly.
                     requeue_if_exists=False,
                 )
-        return
+            )
+    enqueue_jobs_bulk(conn, trend_specs + outcomes_specs + ai_specs)
 
-    if job_type == "FETCH_EOD_PRICES_FOR_ISSUER":
-        issuer_cik = str(payload["issuer_cik"]).zfill(10)
-        fetch_and_store_prices_for_issuer(conn, cfg, issuer_cik)
 
-        # Requeue trend/outcomes jobs that previously failed due to missing_price_series.
-        _requeue_missing_price_dependent_jobs(conn, cfg, issuer_cik)
-        return
+def _handle_fetch_eod_prices_for_issuer(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    issuer_cik = _cik10(payload["issuer_cik"])
+    fetch_and_store_prices_for_issuer(conn, cfg, issuer_cik)
 
-    if job_type == "FETCH_BENCHMARK_PRICES":
-        symbol = str(payload.get("symbol") or cfg.BENCHMARK_SYMBOL).strip()
-        resolved = fetch_and_store_benchmark_prices(conn, cfg, symbol=symbol)
-        upsert_app_config(conn, "benchmark_symbol_resolved", resolved)
+    # Requeue trend/outcomes jobs that previously failed due to missing_price_series.
+    _requeue_missing_price_dependent_jobs(conn, cfg, issuer_cik)
 
-        # Requeue outcomes jobs that were missing benchmark series.
-        _requeue_missing_benchmark_outcomes(conn, cfg)
-        return
 
-    if job_type == "FETCH_MARKET_CAP_FOR_TICKER":
-        ticker = str(payload["ticker"]).strip()
-        fetch_and_store_market_cap(conn, cfg, ticker)
-        return
+def _handle_fetch_benchmark_prices(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    symbol = str(payload.get("symbol") or cfg.BENCHMARK_SYMBOL).strip()
+    resolved = fetch_and_store_benchmark_prices(conn, cfg, symbol=symbol)
+    upsert_app_config(conn, "benchmark_symbol_resolved", resolved)
 
-    if job_type == "FETCH_NEWS_FOR_TICKER":
-        ticker = str(payload["ticker"]).strip()
-        fetch_and_store_news(conn, cfg, ticker)
-        return
+    # Requeue outcomes jobs that were missing benchmark series.
+    _requeue_missing_benchmark_outcomes(conn, cfg)
 
 
-    if job_type == "COMPUTE_TREND_FOR_EVENT":
-        ek = EventKey(
-            issuer_cik=str(payload["issuer_cik"]).zfill(10),
-            owner_key=str(payload["owner_key"]),
-            accession_number=str(payload["accession_number"]),
-        )
-        compute_trend_for_event(conn, ek)
-        return
+def _handle_fetch_market_cap_for_ticker(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    ticker = str(payload["ticker"]).strip()
+    fetch_and_store_market_cap(conn, cfg, ticker)
 
-    if job_type == "COMPUTE_OUTCOMES_FOR_EVENT":
-        ek = EventKey(
-            issuer_cik=str(payload["issuer_cik"]).zfill(10),
-            owner_key=str(payload["owner_key"]),
-            accession_number=str(payload["accession_number"]),
-        )
-        compute_outcomes_for_event(conn, cfg, ek)
 
-        # Outcomes update => recompute stats for this issuer+owner
-        enqueue_job(
-            conn,
-            job_type="COMPUTE_STATS_FOR_OWNER_ISSUER",
-            dedupe_key=f"STATS|{ek.issuer_cik}|{ek.owner_key}|{cfg.CURRENT_STATS_VERSION}",
-            payload={"issuer_cik": ek.issuer_cik, "owner_key": ek.owner_key},
-            priority=60,
-            requeue_if_exists=True,
-        )
-        return
+def _handle_fetch_news_for_ticker(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    ticker = str(payload["ticker"]).strip()
+    fetch_and_store_news(conn, cfg, ticker)
 
-    if job_type == "COMPUTE_STATS_FOR_OWNER_ISSUER":
-        key = OwnerIssuerKey(
-            issuer_cik=str(payload["issuer_cik"]).zfill(10),
-            owner_key=str(payload["owner_key"]),
-        )
-        compute_stats_for_owner_issuer(conn, cfg, key)
-        return
 
-    if job_type == "COMPUTE_CLUSTERS_FOR_TICKER":
-        ticker = str(payload["ticker"]).strip()
-        compute_clusters_for_ticker(conn, cfg, ticker)
+def _handle_compute_trend_for_event(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    ek = EventKey(
+        issuer_cik=_cik10(payload["issuer_cik"]),
+        owner_key=str(payload["owner_key"]),
+        accession_number=str(payload["accession_number"]),
+    )
+    compute_trend_for_event(conn, ek)
+
+
+def _handle_compute_outcomes_for_event(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    ek = EventKey(
+        issuer_cik=_cik10(payload["issuer_cik"]),
+        owner_key=str(payload["owner_key"]),
+        accession_number=str(payload["accession_number"]),
+    )
+    compute_outcomes_for_event(conn, cfg, ek)
+
+    # Outcomes update => recompute stats for this issuer+owner
+    enqueue_job(
+        conn,
+        job_type="COMPUTE_STATS_FOR_OWNER_ISSUER",
+        dedupe_key=f"STATS|{ek.issuer_cik}|{ek.owner_key}|{cfg.CURRENT_STATS_VERSION}",
+        payload={"issuer_cik": ek.issuer_cik, "owner_key": ek.owner_key},
+        priority=60,
+        requeue_if_exists=True,
+    )
+
+
+def _handle_compute_stats_for_owner_issuer(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    key = OwnerIssuerKey(
+        issuer_cik=_cik10(payload["issuer_cik"]),
+        owner_key=str(payload["owner_key"]),
+    )
+    compute_stats_for_owner_issuer(conn, cfg, key)
+
+
+def _handle_compute_clusters_for_ticker(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    ticker = str(payload["ticker"]).strip()
+    compute_clusters_for_ticker(conn, cfg, ticker)
+
+
+def _handle_run_ai_for_event(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    ek = EventKey(
+        issuer_cik=_cik10(payload["issuer_cik"]),
+        owner_key=str(payload["owner_key"]),
+        accession_number=str(payload["accession_number"]),
+    )
+    force = bool(payload.get("force") or False)
+
+    # Only generate AI for poller-discovered (new) filings.
+    # - Backfills/reparses historically created thousands of events and would spam the AI API.
+    # - Admin can override with force=True via /admin/event/.../regenerate_ai
+    ai_requested = bool(payload.get("ai_requested") or False)
+    if not force and not ai_requested:
         return
 
-    if job_type == "RUN_AI_FOR_EVENT":
-        ek = EventKey(
-            issuer_cik=str(payload["issuer_cik"]).zfill(10),
-            owner_key=str(payload["owner_key"]),
-            accession_number=str(payload["accession_number"]),
-        )
-        force = bool(payload.get("force") or False)
-
-        # Only generate AI for poller-discovered (new) filings.
-        # - Backfills/reparses historically created thousands of events and would spam the AI API.
-        # - Admin can override with force=True via /admin/event/.../regenerate_ai
-        ai_requested = bool(payload.get("ai_requested") or False)
-        if not force and not ai_requested:
-            return
-
-        prereq = conn.execute(
-            """
-            SELECT ticker, trend_computed_at, stats_computed_at, cluster_computed_at
-            FROM insider_events
-            WHERE issuer_cik=? AND owner_key=? AND accession_number=?
-            """,
-            (ek.issuer_cik, ek.owner_key, ek.accession_number),
-        ).fetchone()
-
-        if prereq is None:
-            raise RuntimeError("event_missing")
-
-        # If prerequisites are missing, enqueue the missing work and DEFER this AI job
-        # (do not consume an attempt / do not mark the job as an error).
-        if prereq["stats_computed_at"] is None:
-            enqueue_job(
-                conn,
+    prereq = conn.execute(
+        """
+        SELECT ticker, trend_computed_at, stats_computed_at, cluster_computed_at, has_buy, has_sell
+        FROM insider_events
+        WHERE issuer_cik=? AND owner_key=? AND accession_number=?
+        """,
+        (ek.issuer_cik, ek.owner_key, ek.accession_number),
+    ).fetchone()
+
+    if prereq is None:
+        raise RuntimeError("event_missing")
+
+    # If prerequisites are missing, enqueue ALL the missing work in one write and DEFER
+    # this AI job once, for the longest wait (do not consume an attempt / do not mark
+    # the job as an error).
+    missing = []
+    retry_after = 0
+    if prereq["stats_computed_at"] is None:
+        missing.append(
+            EnqueueSpec(
                 job_type="COMPUTE_STATS_FOR_OWNER_ISSUER",
                 dedupe_key=f"STATS|{ek.issuer_cik}|{ek.owner_key}|{cfg.CURRENT_STATS_VERSION}",
                 payload={"issuer_cik": ek.issuer_cik, "owner_key": ek.owner_key},
                 priority=60,
                 requeue_if_exists=True,
             )
-            raise JobDeferred("ai_prereq_missing_stats", retry_after_seconds=45)
+        )
+        retry_after = max(retry_after, 45)
 
-        if prereq["trend_computed_at"] is None:
-            enqueue_job(
-                conn,
+    if prereq["trend_computed_at"] is None:
+        missing.append(
+            EnqueueSpec(
                 job_type="COMPUTE_TREND_FOR_EVENT",
                 dedupe_key=f"TREND|{ek.issuer_cik}|{ek.owner_key}|{ek.accession_number}|{cfg.CURRENT_TREND_VERSION}",
                 payload={"issuer_cik": ek.issuer_cik, "owner_key": ek.owner_key, "accession_number": ek.accession_number},
-                priority=40,
+                priority=_TREND_PRIORITY,
                 requeue_if_exists=True,
             )
-            raise JobDeferred("ai_prereq_missing_trend", retry_after_seconds=45)
-
-        # Cluster is only required when we have a ticker (otherwise clustering isn't possible)
-        if prereq["ticker"] and prereq["cluster_computed_at"] is None:
-            t = str(prereq["ticker"]).strip()
-            if t:
-                enqueue_job(
-                    conn,
+        )
+        retry_after = max(retry_after, 45)
+
+    # Cluster is only required when we have a ticker (otherwise clustering isn't possible)
+    missing_cluster = bool(prereq["ticker"]) and prereq["cluster_computed_at"] is None
+    if missing_cluster:
+        t = str(prereq["ticker"]).strip()
+        if t:
+            missing.append(
+                EnqueueSpec(
                     job_type="COMPUTE_CLUSTERS_FOR_TICKER",
                     dedupe_key=f"CLUSTERS|{t}|{cfg.CURRENT_CLUSTER_VERSION}",
                     payload={"ticker": t},
                     priority=30,
                     requeue_if_exists=True,
                 )
-            raise JobDeferred("ai_prereq_missing_cluster", retry_after_seconds=90)
-
-        row = conn.execute(
-            """
-            SELECT has_buy, has_sell
-            FROM insider_events
-            WHERE issuer_cik=? AND owner_key=? AND accession_number=?
-            """,
-            (ek.issuer_cik, ek.owner_key, ek.accession_number),
-        ).fetchone()
-        has_buy = bool(row["has_buy"]) if row else False
-        has_sell = bool(row["has_sell"]) if row else False
-
-        if has_buy or has_sell:
-            run_ai_for_event(conn, cfg, ek, force=force)
-        return
+            )
+        retry_after = max(retry_after, 90)
+
+    if retry_after:
+        enqueue_jobs_bulk(conn, missing)
+        reasons = [
+            name
+            for name, is_missing in (
+                ("stats", prereq["stats_computed_at"] is None),
+                ("trend", prereq["trend_computed_at"] is None),
+                ("cluster", missing_cluster),
+            )
+            if is_missing
+        ]
+        raise JobDeferred("ai_prereq_missing_" + ",".join(reasons), retry_after_seconds=retry_after)
+
+    has_buy = bool(prereq["has_buy"] or 0)
+    has_sell = bool(prereq["has_sell"] or 0)
+
+    if has_buy or has_sell:
+        run_ai_for_event(conn, cfg, ek, force=force)
+
+
+# -------------------------------------------------------------------------
+# ADMIN / MAINTENANCE
+# -------------------------------------------------------------------------
+def _handle_reparse_ticker(conn: Any, cfg: Config, payload: Dict[str, Any]) -> None:
+    ticker = str(payload["ticker"]).strip()
+    _enqueue_reparse_ticker(conn, cfg, ticker)
+
+
+# job_type -> handler(conn, cfg, payload). Built once at import; run_worker_forever
+# validates its allowlist against the keys.
+_DISPATCH: Dict[str, Callable[[Any, Config, Dict[str, Any]], None]] = {
+    "FETCH_ACCESSION_DOCS": _handle_fetch_accession_docs,
+    "INGEST_ACCESSION": _handle_fetch_accession_docs,
+    "PARSE_ACCESSION_DOCS": _handle_parse_accession_docs,
+    "BACKFILL_DISCOVER_ISSUER": _handle_backfill_discover_issuer,
+    "BACKFILL_ENQUEUE_BATCH": _handle_backfill_enqueue_batch,
+    "AGGREGATE_ACCESSION": _handle_aggregate_accession,
+    "FETCH_EOD_PRICES_FOR_ISSUER": _handle_fetch_eod_prices_for_issuer,
+    "FETCH_BENCHMARK_PRICES": _handle_fetch_benchmark_prices,
+    "FETCH_MARKET_CAP_FOR_TICKER": _handle_fetch_market_cap_for_ticker,
+    "FETCH_NEWS_FOR_TICKER": _handle_fetch_news_for_ticker,
+    "COMPUTE_TREND_FOR_EVENT": _handle_compute_trend_for_event,
+    "COMPUTE_OUTCOMES_FOR_EVENT": _handle_compute_outcomes_for_event,
+    "COMPUTE_STATS_FOR_OWNER_ISSUER": _handle_compute_stats_for_owner_issuer,
+    "COMPUTE_CLUSTERS_FOR_TICKER": _handle_compute_clusters_for_ticker,
+    "RUN_AI_FOR_EVENT": _handle_run_ai_for_event,
+    "REPARSE_TICKER": _handle_reparse_ticker,
+}
 
-    # -------------------------------------------------------------------------
-    # ADMIN / MAINTENANCE
-    # -------------------------------------------------------------------------
-    if job_type == "REPARSE_TICKER":
-        ticker = str(payload["ticker"]).strip()
-        _enqueue_reparse_ticker(conn, cfg, ticker)
-        return
 
-    raise RuntimeError(f"Unknown job_type: {job_type}")
+def _run_job(conn: Any, cfg: Config, job_type: str, payload: Dict[str, Any]) -> None:
+    handler = _DISPATCH.get(job_type)
+    if handler is None:
+        raise RuntimeError(f"Unknown job_type: {job_type}")
+    handler(conn, cfg, payload)
 
 
 def _requeue_missing_price_dependent_jobs(conn: Any, cfg: Config, issuer_cik: str) -> None:
-    # Trend jobs
-    trend_rows = conn.execute(
+    # Trend + outcomes jobs for events that were missing the price series (UNION dedupes).
+    rows = conn.execute(
         """
         SELECT issuer_cik, owner_key, accession_number
         FROM insider_events
         WHERE issuer_cik=? AND trend_missing_reason='missing_price_series'
-        """,
-        (issuer_cik,),
-    ).fetchall()
-
-    # Outcomes jobs
-    out_rows = conn.execute(
-        """
-        SELECT DISTINCT issuer_cik, owner_key, accession_number
+        UNION
+        SELECT issuer_cik, owner_key, accession_number
         FROM event_outcomes
         WHERE issuer_cik=? AND (missing_reason_60d='missing_price_series' OR missing_reason_180d='missing_price_series')
         """,
-        (issuer_cik,),
+        (issuer_cik, issuer_cik),
     ).fetchall()
 
-    keys: Set[tuple[str, str, str]] = set()
-    for r in trend_rows:
-        keys.add((str(r["issuer_cik"]), str(r["owner_key"]), str(r["accession_number"])))
-    for r in out_rows:
-        keys.add((str(r["issuer_cik"]), str(r["owner_key"]), str(r["accession_number"])))
-
-    for issuer_cik, owner_key, accession in keys:
-        enqueue_job(
-            conn,
-            job_type="COMPUTE_TREND_FOR_EVENT",
-            dedupe_key=f"TREND|{issuer_cik}|{owner_key}|{accession}|{cfg.CURRENT_TREND_VERSION}",
-            payload={"issuer_cik": issuer_cik, "owner_key": owner_key, "accession_number": accession},
-            priority=40,
-            requeue_if_exists=True,
+    trend_v = cfg.CURRENT_TREND_VERSION
+    out_v = cfg.CURRENT_OUTCOMES_VERSION
+    specs = []
+    for r in rows:
+        issuer_cik, owner_key, accession = str(r["issuer_cik"]), str(r["owner_key"]), str(r["accession_number"])
+        payload = {"issuer_cik": issuer_cik, "owner_key": owner_key, "accession_number": accession}
+        payload_json = jsonutil.dumps(payload)
+        specs.append(
+            EnqueueSpec(
+                job_type="COMPUTE_TREND_FOR_EVENT",
+                dedupe_key=f"TREND|{issuer_cik}|{owner_key}|{accession}|{trend_v}",
+                payload=payload,
+                payload_json=payload_json,
+                priority=_TREND_PRIORITY,
+                requeue_if_exists=True,
+            )
         )
-        enqueue_job(
-            conn,
-            job_type="COMPUTE_OUTCOMES_FOR_EVENT",
-            dedupe_key=f"OUT|{issuer_cik}|{owner_key}|{accession}|{cfg.CURRENT_OUTCOMES_VERSION}",
-            payload={"issuer_cik": issuer_cik, "owner_key": owner_key, "accession_number": accession},
-            priority=50,
-            requeue_if_exists=True,
+        specs.append(
+            EnqueueSpec(
+                job_type="COMPUTE_OUTCOMES_FOR_EVENT",
+                dedupe_key=f"OUT|{issuer_cik}|{owner_key}|{accession}|{out_v}",
+                payload=payload,
+                payload_json=payload_json,
+                priority=_OUTCOMES_PRIORITY,
+                requeue_if_exists=True,
+            )
         )
+    enqueue_jobs_bulk(conn, specs)
 
 
 def _requeue_missing_benchmark_outcomes(conn: Any, cfg: Config) -> None:
@@ -653,18 +826,22 @@ def _requeue_missing_benchmark_outcomes(conn: Any, cfg: Config) -> None:
         """
     ).fetchall()
 
+    out_v = cfg.CURRENT_OUTCOMES_VERSION
+    specs = []
     for r in rows:
-        issuer_cik = str(r["issuer_cik"]).zfill(10)
+        issuer_cik = _cik10(r["issuer_cik"])
         owner_key = str(r["owner_key"])
         accession = str(r["accession_number"])
-        enqueue_job(
-            conn,
-            job_type="COMPUTE_OUTCOMES_FOR_EVENT",
-            dedupe_key=f"OUT|{issuer_cik}|{owner_key}|{accession}|{cfg.CURRENT_OUTCOMES_VERSION}",
-            payload={"issuer_cik": issuer_cik, "owner_key": owner_key, "accession_number": accession},
-            priority=55,
-            requeue_if_exists=True,
+        specs.append(
+            EnqueueSpec(
+                job_type="COMPUTE_OUTCOMES_FOR_EVENT",
+                dedupe_key=f"OUT|{issuer_cik}|{owner_key}|{accession}|{out_v}",
+                payload={"issuer_cik": issuer_cik, "owner_key": owner_key, "accession_number": accession},
+                priority=55,
+                requeue_if_exists=True,
+            )
         )
+    enqueue_jobs_bulk(conn, specs)
 
 
 def _enqueue_reparse_ticker(conn: Any, cfg: Config, ticker: str) -> None:
@@ -676,26 +853,38 @@ def _enqueue_reparse_ticker(conn: Any, cfg: Config, ticker: str) -> None:
     accessions = [str(r["accession_number"]) for r in rows]
     _debug(f"REPARSE_TICKER ticker={ticker} accessions={len(accessions)}")
 
+    if not accessions:
+        return
+
+    have_doc = {
+        str(r["accession_number"])
+        for r in conn.execute(
+            "SELECT DISTINCT accession_number FROM filing_documents WHERE accession_number = ANY(?)",
+            (accessions,),
+        ).fetchall()
+    }
+
+    parse_v = cfg.CURRENT_PARSE_VERSION
+    specs = []
     for acc in accessions:
-        doc = conn.execute(
-            "SELECT 1 FROM filing_documents WHERE accession_number=? LIMIT 1",
-            (acc,),
-        ).fetchone()
-        if doc:
-            enqueue_job(
-                conn,
-                job_type="PARSE_ACCESSION_DOCS",
-                dedupe_key=f"PARSE|{acc}|{cfg.CURRENT_PARSE_VERSION}",
-                payload={"accession_number": acc, "ingest_source": "reparse", "ai_requested": False},
-                priority=5,
-                requeue_if_exists=True,
+        if acc in have_doc:
+            specs.append(
+                EnqueueSpec(
+                    job_type="PARSE_ACCESSION_DOCS",
+                    dedupe_key=f"PARSE|{acc}|{parse_v}",
+                    payload={"accession_number": acc, "ingest_source": "reparse", "ai_requested": False},
+                    priority=5,
+                    requeue_if_exists=True,
+                )
             )
         else:
-            enqueue_job(
-                conn,
-                job_type="FETCH_ACCESSION_DOCS",
-                dedupe_key=f"FETCH|{acc}",
-                payload={"accession_number": acc, "ingest_source": "reparse", "ai_requested": False},
-                priority=5,
-                requeue_if_exists=True,
+            specs.append(
+                EnqueueSpec(
+                    job_type="FETCH_ACCESSION_DOCS",
+                    dedupe_key=f"FETCH|{acc}",
+                    payload={"accession_number": acc, "ingest_source": "reparse", "ai_requested": False},
+                    priority=5,
+                    requeue_if_exists=True,
+                )
             )
+    enqueue_jobs_bulk(conn, specs)
@@ -3,14 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventKey:
     issuer_cik: str
     owner_key: str
     accession_number: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OwnerIssuerKey:
     issuer_cik: str
     owner_key: str
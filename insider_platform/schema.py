@@ -5,9 +5,13 @@ from __future__ import annotations
 PostgreSQL is the only supported database engine.
 """
 
+import re
+from typing import Tuple
+
 # NOTE:
 # - We store timestamps as ISO strings (UTC, ending with 'Z') for simplicity.
 # - This schema is intentionally light on constraints; application code enforces most invariants.
+# - 0/1 flags are SMALLINT (not BOOLEAN) so existing `flag=1` predicates and int writes keep working.
 
 SCHEMA_POSTGRES = r"""CREATE TABLE IF NOT EXISTS app_config (
     key TEXT PRIMARY KEY,
@@ -22,7 +26,7 @@ CREATE TABLE IF NOT EXISTS users (
     username TEXT NOT NULL UNIQUE,
     password_hash TEXT NOT NULL,
     role TEXT NOT NULL CHECK (role IN ('admin','user')),
-    is_active INTEGER NOT NULL DEFAULT 1,
+    is_active SMALLINT NOT NULL DEFAULT 1,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
     last_login_at TEXT,
@@ -33,7 +37,7 @@ CREATE TABLE IF NOT EXISTS users (
     stripe_price_id TEXT,
     subscription_status TEXT, -- e.g. active|trialing|past_due|canceled
     current_period_end TEXT,
-    cancel_at_period_end INTEGER NOT NULL DEFAULT 0,
+    cancel_at_period_end SMALLINT NOT NULL DEFAULT 0,
     subscription_updated_at TEXT
 );
 CREATE INDEX IF NOT EXISTS idx_users_role_active ON users (role, is_active);
@@ -129,8 +133,8 @@ CREATE TABLE IF NOT EXISTS form4_rows_raw (
     owner_cik TEXT,
     owner_name_raw TEXT,
     owner_name_normalized TEXT,
-    owner_name_hash TEXT,
-    is_derivative INTEGER NOT NULL,
+    owner_name_hash BYTEA,  -- raw SHA-256 digest (32 bytes, half the width of the hex text)
+    is_derivative SMALLINT NOT NULL,
     transaction_code TEXT,
     transaction_date TEXT,
     shares_raw DOUBLE PRECISION,
@@ -141,7 +145,9 @@ CREATE TABLE IF NOT EXISTS form4_rows_raw (
     parser_warnings_json TEXT,
     raw_payload_json TEXT NOT NULL
 );
-CREATE INDEX IF NOT EXISTS idx_rows_accession ON form4_rows_raw (accession_number);
+-- Per-filing lookups (owner fan-out in aggregation, re-ingest delete); the INCLUDE makes
+-- the DISTINCT owner_key scan index-only.
+CREATE INDEX IF NOT EXISTS idx_rows_accession_issuer ON form4_rows_raw (accession_number, issuer_cik) INCLUDE (owner_key);
 CREATE INDEX IF NOT EXISTS idx_rows_eventkey ON form4_rows_raw (issuer_cik, owner_key, accession_number);
 CREATE INDEX IF NOT EXISTS idx_rows_issuer_code_date ON form4_rows_raw (issuer_cik, transaction_code, transaction_date);
 
@@ -157,12 +163,12 @@ CREATE TABLE IF NOT EXISTS insider_events (
     owner_cik TEXT,
     owner_name_display TEXT,
     owner_title TEXT,
-    is_officer INTEGER,
-    is_director INTEGER,
-    is_ten_percent_owner INTEGER,
+    is_officer SMALLINT,
+    is_director SMALLINT,
+    is_ten_percent_owner SMALLINT,
 
     -- Buy (P)
-    has_buy INTEGER NOT NULL DEFAULT 0,
+    has_buy SMALLINT NOT NULL DEFAULT 0,
     buy_trade_date TEXT,
     buy_last_tx_date TEXT,
     buy_shares_total DOUBLE PRECISION,
@@ -170,13 +176,13 @@ CREATE TABLE IF NOT EXISTS insider_events (
     buy_vwap_price DOUBLE PRECISION,
     buy_priced_shares_total DOUBLE PRECISION,
     buy_unpriced_shares_total DOUBLE PRECISION,
-    buy_vwap_is_partial INTEGER,
+    buy_vwap_is_partial SMALLINT,
     buy_shares_owned_following DOUBLE PRECISION,
     buy_pct_holdings_change DOUBLE PRECISION,
     buy_pct_change_missing_reason TEXT,
 
     -- Sell (S)
-    has_sell INTEGER NOT NULL DEFAULT 0,
+    has_sell SMALLINT NOT NULL DEFAULT 0,
     sell_trade_date TEXT,
     sell_last_tx_date TEXT,
     sell_shares_total DOUBLE PRECISION,
@@ -184,7 +190,7 @@ CREATE TABLE IF NOT EXISTS insider_events (
     sell_vwap_price DOUBLE PRECISION,
     sell_priced_shares_total DOUBLE PRECISION,
     sell_unpriced_shares_total DOUBLE PRECISION,
-    sell_vwap_is_partial INTEGER,
+    sell_vwap_is_partial SMALLINT,
     sell_shares_owned_following DOUBLE PRECISION,
     sell_pct_holdings_change DOUBLE PRECISION,
     sell_pct_change_missing_reason TEXT,
@@ -200,14 +206,14 @@ CREATE TABLE IF NOT EXISTS insider_events (
     trend_ret_60d DOUBLE PRECISION,
     trend_dist_52w_high DOUBLE PRECISION,
     trend_dist_52w_low DOUBLE PRECISION,
-    trend_above_sma_50 INTEGER,
-    trend_above_sma_200 INTEGER,
+    trend_above_sma_50 SMALLINT,
+    trend_above_sma_200 SMALLINT,
     trend_missing_reason TEXT,
 
     -- Cluster
-    cluster_flag_buy INTEGER,
+    cluster_flag_buy SMALLINT,
     cluster_id_buy TEXT,
-    cluster_flag_sell INTEGER,
+    cluster_flag_sell SMALLINT,
     cluster_id_sell TEXT,
 
     -- Market cap snapshot (denormalized)
@@ -233,12 +239,15 @@ CREATE TABLE IF NOT EXISTS insider_events (
     ai_computed_at TEXT,
 
     PRIMARY KEY (issuer_cik, owner_key, accession_number)
-);
+) WITH (fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05);  -- enrichment jobs update rows in place
 CREATE INDEX IF NOT EXISTS idx_events_ticker_date ON insider_events (ticker, filing_date);
 CREATE INDEX IF NOT EXISTS idx_events_issuer_owner_date ON insider_events (issuer_cik, owner_key, filing_date);
 CREATE INDEX IF NOT EXISTS idx_events_ticker_trade ON insider_events (ticker, event_trade_date);
 CREATE INDEX IF NOT EXISTS idx_events_cluster_buy ON insider_events (ticker, cluster_flag_buy);
 CREATE INDEX IF NOT EXISTS idx_events_cluster_sell ON insider_events (ticker, cluster_flag_sell);
+-- Events waiting on a price series (requeued after FETCH_EOD_PRICES_FOR_ISSUER).
+CREATE INDEX IF NOT EXISTS idx_events_missing_prices ON insider_events (issuer_cik)
+    WHERE trend_missing_reason='missing_price_series';
 
 CREATE TABLE IF NOT EXISTS event_outcomes (
     issuer_cik TEXT NOT NULL,
@@ -258,7 +267,7 @@ CREATE TABLE IF NOT EXISTS event_outcomes (
     bench_symbol TEXT,
     bench_return_60d DOUBLE PRECISION,
     bench_missing_reason_60d TEXT,
-    excess_return_60d DOUBLE PRECISION,
+    excess_return_60d DOUBLE PRECISION GENERATED ALWAYS AS (return_60d - bench_return_60d) STORED,
 
     future_date_180d TEXT,
     future_price_180d DOUBLE PRECISION,
@@ -267,14 +276,16 @@ CREATE TABLE IF NOT EXISTS event_outcomes (
 
     bench_return_180d DOUBLE PRECISION,
     bench_missing_reason_180d TEXT,
-    excess_return_180d DOUBLE PRECISION,
+    excess_return_180d DOUBLE PRECISION GENERATED ALWAYS AS (return_180d - bench_return_180d) STORED,
 
     outcomes_version TEXT NOT NULL,
     computed_at TEXT NOT NULL,
 
     PRIMARY KEY (issuer_cik, owner_key, accession_number, side)
 );
-CREATE INDEX IF NOT EXISTS idx_outcomes_issuer_owner_side ON event_outcomes (issuer_cik, owner_key, side);
+-- Stats covering index (idx_outcomes_stats_cover) is created in db._migrate, after the excess_return_* columns exist.
+CREATE INDEX IF NOT EXISTS idx_outcomes_missing_prices ON event_outcomes (issuer_cik)
+    WHERE missing_reason_60d='missing_price_series' OR missing_reason_180d='missing_price_series';
 
 CREATE TABLE IF NOT EXISTS issuer_prices_daily (
     issuer_cik TEXT NOT NULL,
@@ -284,7 +295,7 @@ CREATE TABLE IF NOT EXISTS issuer_prices_daily (
     updated_at TEXT NOT NULL,
     PRIMARY KEY (issuer_cik, date)
 );
-CREATE INDEX IF NOT EXISTS idx_prices_issuer_date ON issuer_prices_daily (issuer_cik, date);
+-- (issuer_cik, date) lookups and ranges are served by the primary key index.
 CREATE TABLE IF NOT EXISTS benchmark_prices_daily (
     symbol TEXT NOT NULL,
     date TEXT NOT NULL,
@@ -292,7 +303,6 @@ CREATE TABLE IF NOT EXISTS benchmark_prices_daily (
     updated_at TEXT NOT NULL,
     PRIMARY KEY (symbol, date)
 );
-CREATE INDEX IF NOT EXISTS idx_benchmark_prices_symbol_date ON benchmark_prices_daily (symbol, date);
 
 
 CREATE TABLE IF NOT EXISTS clusters (
@@ -342,7 +352,6 @@ CREATE TABLE IF NOT EXISTS insider_issuer_stats (
 
     PRIMARY KEY (issuer_cik, owner_key, side)
 );
-CREATE INDEX IF NOT EXISTS idx_stats_issuer_owner ON insider_issuer_stats (issuer_cik, owner_key);
 
 CREATE TABLE IF NOT EXISTS market_cap_cache (
     ticker TEXT PRIMARY KEY,
@@ -388,23 +397,29 @@ CREATE TABLE IF NOT EXISTS backfill_queue (
     PRIMARY KEY (issuer_cik, accession_number)
 );
 CREATE INDEX IF NOT EXISTS idx_backfill_status ON backfill_queue (status, issuer_cik, filing_date);
+-- Next-batch pick / "any pending left?" probe; only covers rows still waiting.
+CREATE INDEX IF NOT EXISTS idx_backfill_pending ON backfill_queue (issuer_cik, filing_date) WHERE status='pending';
 
 CREATE TABLE IF NOT EXISTS jobs (
     job_id BIGSERIAL PRIMARY KEY,
     job_type TEXT NOT NULL,
     status TEXT NOT NULL CHECK (status IN ('pending','running','success','error')),
     priority INTEGER NOT NULL DEFAULT 100,
-    dedupe_key TEXT NOT NULL UNIQUE,
-    payload_json TEXT NOT NULL,
+    dedupe_key TEXT NOT NULL,
+    -- 64-bit hash of dedupe_key; the unique index (created in db._migrate) is on this column.
+    dedupe_hash BIGINT GENERATED ALWAYS AS (hashtextextended(dedupe_key, 0)) STORED,
+    payload_json JSONB NOT NULL,
     attempts INTEGER NOT NULL DEFAULT 0,
     max_attempts INTEGER NOT NULL DEFAULT 3,
     last_error TEXT,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
-    run_after TEXT
-);
+    run_after TEXT,
+    run_after_ms BIGINT -- epoch millis mirror of run_after; the claim query filters on this
+) WITH (fillfactor = 70);  -- every job row is updated several times (claim, success/error)
 CREATE INDEX IF NOT EXISTS idx_jobs_status_priority ON jobs (status, priority, created_at);
 CREATE INDEX IF NOT EXISTS idx_jobs_run_after ON jobs (run_after);
+-- Claim path index (idx_jobs_claim_ms) is created in db._migrate, after run_after_ms exists.
 
 CREATE TABLE IF NOT EXISTS data_issues (
     issue_id BIGSERIAL PRIMARY KEY,
@@ -449,6 +464,22 @@ CREATE TABLE IF NOT EXISTS issuer_news (
 CREATE INDEX IF NOT EXISTS idx_news_ticker_published ON issuer_news (ticker, published_at);"""
 
 
+def _split_statements(ddl: str) -> Tuple[str, ...]:
+    # Strip `--` comments first: they may contain ';' or '?' (the latter would be taken
+    # for a placeholder by the qmark translation in db.execute).
+    body = re.sub(r"--[^\n]*", "", ddl)
+    return tuple(s.strip() for s in body.split(";") if s.strip())
+
+
+# Split once at import; the per-statement DDL path reuses it.
+SCHEMA_POSTGRES_STATEMENTS = _split_statements(SCHEMA_POSTGRES)
+
+
 def get_schema_sql() -> str:
     """Return the PostgreSQL schema DDL."""
     return SCHEMA_POSTGRES
+
+
+def get_schema_statements() -> Tuple[str, ...]:
+    """Return the PostgreSQL schema DDL as individual statements (comments removed)."""
+    return SCHEMA_POSTGRES_STATEMENTS
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import time
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 
 from insider_platform.config import Config
+from insider_platform.sec.ratelimit import throttle
 from insider_platform.util.time import utcnow_iso
 
 
@@ -15,27 +15,17 @@ def _debug(msg: str) -> None:
     print(f"[backfill] {msg}")
 
 
-# Per-process polite throttling for SEC endpoints.
-_SEC_LAST_REQUEST_MONO: float = 0.0
-_SEC_LOCK = threading.Lock()
+# Keep-alive session shared by all discovery requests (and the block-fetch threads).
+_SESSION = requests.Session()
 
-
-def _throttle(min_interval_seconds: float | None) -> None:
-    if not min_interval_seconds or min_interval_seconds <= 0:
-        return
-    global _SEC_LAST_REQUEST_MONO
-    with _SEC_LOCK:
-        now = time.monotonic()
-        dt = now - _SEC_LAST_REQUEST_MONO
-        if dt < min_interval_seconds:
-            time.sleep(min_interval_seconds - dt)
-        _SEC_LAST_REQUEST_MONO = time.monotonic()
+# Historical filing blocks fetched concurrently per issuer (request starts still go through throttle).
+_BLOCK_FETCH_WORKERS = 8
 
 
 def _get_json(url: str, user_agent: str, min_interval_seconds: float | None = None) -> Dict[str, Any]:
     _debug(f"GET {url}")
-    _throttle(min_interval_seconds)
-    r = requests.get(url, headers={"User-Agent": user_agent}, timeout=60)
+    throttle(min_interval_seconds)
+    r = _SESSION.get(url, headers={"User-Agent": user_agent}, timeout=60)
     if r.status_code != 200:
         raise RuntimeError(f"SEC request failed {r.status_code}: {r.text}")
     return r.json()
@@ -85,32 +75,38 @@ def discover_form4_accessions_for_issuer(
     now = utcnow_iso()
     inserted = 0
 
+    queued: set[str] = set()
+
     def insert_many(candidates: List[Tuple[str, str | None, str | None]]) -> int:
         nonlocal inserted
-        n = 0
+        rows = []
         for acc, form, dt in candidates:
-            if acc in existing:
+            if acc in existing or acc in queued:
                 continue
             if dt and dt < start_date:
                 continue
             if not _is_form4(form):
                 continue
+            # One row per accession: a multi-row ON CONFLICT DO UPDATE can't touch a row twice.
+            queued.add(acc)
+            rows.append((cik10, acc, dt, form, now, now))
 
+        if rows:
             # upsert but do not downgrade status if already fetched/parsed
-            conn.execute(
+            conn.executemany_fast(
                 """
                 INSERT INTO backfill_queue (issuer_cik, accession_number, filing_date, form_type, status, last_error, created_at, updated_at)
-                VALUES (?,?,?,?, 'pending', NULL, ?, ?)
+                VALUES %s
                 ON CONFLICT(issuer_cik, accession_number) DO UPDATE SET
                     filing_date=COALESCE(backfill_queue.filing_date, excluded.filing_date),
                     form_type=COALESCE(backfill_queue.form_type, excluded.form_type),
                     updated_at=excluded.updated_at
                 """,
-                (cik10, acc, dt, form, now, now),
+                rows,
+                template="(%s, %s, %s, %s, 'pending', NULL, %s, %s)",
             )
-            n += 1
-        inserted += n
-        return n
+        inserted += len(rows)
+        return len(rows)
 
     # Main submissions JSON
     url = f"https://data.sec.gov/submissions/CIK{cik10}.json"
@@ -121,6 +117,7 @@ def discover_form4_accessions_for_issuer(
 
     # Historical file blocks (each is another JSON under submissions/{name})
     files = (data.get("filings") or {}).get("files") or []
+    names: List[str] = []
     for f in files:
         name = str((f or {}).get("name") or "").strip()
         if not name:
@@ -130,15 +127,24 @@ def discover_form4_accessions_for_issuer(
         filing_to = str((f or {}).get("filingTo") or "").strip()
         if filing_to and filing_to < start_date:
             continue
+        names.append(name)
 
+    def fetch_block(name: str) -> Optional[List[Tuple[str, str | None, str | None]]]:
         try:
             url2 = f"https://data.sec.gov/submissions/{name}"
             data2 = _get_json(url2, cfg.SEC_USER_AGENT, getattr(cfg, "SEC_MIN_INTERVAL_SECONDS", None))
             recent2 = (data2.get("filings") or {}).get("recent") or {}
-            insert_many(list(_iter_recent(recent2)))
+            return list(_iter_recent(recent2))
         except Exception as e:
             _debug(f"Skipping filings block {name}: {e}")
-            continue
+            return None
+
+    # Fetch blocks concurrently (network-bound); DB writes stay on this thread, in block order.
+    if names:
+        with ThreadPoolExecutor(max_workers=min(_BLOCK_FETCH_WORKERS, len(names))) as ex:
+            for candidates in ex.map(fetch_block, names):
+                if candidates is not None:
+                    insert_many(candidates)
 
     _debug(f"Backfill discovery issuer={cik10} start_year={start_year} inserted={inserted}")
     return inserted
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import re
-import time
-import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from insider_platform.sec.ratelimit import throttle
+
 
 @dataclass(frozen=True)
 class FilingMetadata:
@@ -22,21 +22,8 @@ def _debug(msg: str) -> None:
     print(f"[sec] {msg}")
 
 
-# Per-process polite throttling for SEC endpoints.
-_SEC_LAST_REQUEST_MONO: float = 0.0
-_SEC_LOCK = threading.Lock()
-
-
-def _throttle(min_interval_seconds: float | None) -> None:
-    if not min_interval_seconds or min_interval_seconds <= 0:
-        return
-    global _SEC_LAST_REQUEST_MONO
-    with _SEC_LOCK:
-        now = time.monotonic()
-        dt = now - _SEC_LAST_REQUEST_MONO
-        if dt < min_interval_seconds:
-            time.sleep(min_interval_seconds - dt)
-        _SEC_LAST_REQUEST_MONO = time.monotonic()
+# Keep-alive session shared by all SEC requests from this module.
+_SESSION = requests.Session()
 
 
 def _normalize_accession(accession_number: str) -> str:
@@ -61,8 +48,8 @@ def _accession_nodash(accession_number: str) -> str:
 
 def _get_json(url: str, user_agent: str, min_interval_seconds: float | None = None) -> Dict[str, Any]:
     _debug(f"GET {url}")
-    _throttle(min_interval_seconds)
-    r = requests.get(url, headers={"User-Agent": user_agent}, timeout=60)
+    throttle(min_interval_seconds)
+    r = _SESSION.get(url, headers={"User-Agent": user_agent}, timeout=60)
     if r.status_code != 200:
         raise RuntimeError(f"SEC request failed {r.status_code}: {r.text}")
     return r.json()
@@ -70,8 +57,8 @@ def _get_json(url: str, user_agent: str, min_interval_seconds: float | None = No
 
 def _get_text(url: str, user_agent: str, min_interval_seconds: float | None = None) -> str:
     _debug(f"GET {url}")
-    _throttle(min_interval_seconds)
-    r = requests.get(url, headers={"User-Agent": user_agent}, timeout=60)
+    throttle(min_interval_seconds)
+    r = _SESSION.get(url, headers={"User-Agent": user_agent}, timeout=60)
     if r.status_code != 200:
         raise RuntimeError(f"SEC request failed {r.status_code}: {r.text}")
     return r.text
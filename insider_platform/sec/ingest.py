@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from insider_platform.config import Config
 from insider_platform.models import EventKey
@@ -257,6 +257,7 @@ def parse_accession_document(
                 }
             )
 
+    raw_rows: List[Tuple[Any, ...]] = []
     for ro in parsed_owners:
         oid = ro["identity"]
         event_keys.append(EventKey(issuer_cik=issuer_cik, owner_key=oid.owner_key, accession_number=acc))
@@ -290,16 +291,7 @@ def parse_accession_document(
                 "is_entity_guess": oid.is_entity_name_guess,
             }
 
-            conn.execute(
-                """
-                INSERT INTO form4_rows_raw (
-                    accession_number, issuer_cik,
-                    owner_key, owner_cik, owner_name_raw, owner_name_normalized, owner_name_hash,
-                    is_derivative, transaction_code, transaction_date,
-                    shares_raw, shares_abs, price_raw, price, shares_owned_following,
-                    parser_warnings_json, raw_payload_json
-                ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                """,
+            raw_rows.append(
                 (
                     acc,
                     issuer_cik,
@@ -318,9 +310,25 @@ def parse_accession_document(
                     tx.shares_owned_following,
                     json.dumps(warnings) if warnings else None,
                     json.dumps(raw_payload, ensure_ascii=False),
-                ),
+                )
             )
 
+    if raw_rows:
+        # One multi-row INSERT per filing (owners x transactions), rows kept in loop order.
+        conn.executemany_fast(
+            """
+            INSERT INTO form4_rows_raw (
+                accession_number, issuer_cik,
+                owner_key, owner_cik, owner_name_raw, owner_name_normalized, owner_name_hash,
+                is_derivative, transaction_code, transaction_date,
+                shares_raw, shares_abs, price_raw, price, shares_owned_following,
+                parser_warnings_json, raw_payload_json
+            ) VALUES %s
+            """,
+            raw_rows,
+            template="(%s, %s, %s, %s, %s, %s, decode(%s, 'hex'), %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        )
+
     # backfill bookkeeping
     conn.execute(
         """
@@ -0,0 +1,50 @@
+"""Process-wide SEC request pacing shared by the edgar and backfill modules."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens/second, holding at most ``capacity``.
+
+    ``acquire`` reserves a token under the lock (the balance may go negative) and sleeps
+    off any deficit *after* releasing it, so waiting threads queue up in order without
+    blocking each other on the lock.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# One bucket per configured interval (in practice a single one: cfg.SEC_MIN_INTERVAL_SECONDS).
+# Capacity 1 keeps any 1s window under SEC's 10 req/s cap at the default 0.12s interval.
+_BUCKETS: Dict[float, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def throttle(min_interval_seconds: float | None) -> None:
+    """Block until an SEC request may start (no-op when the interval is unset or <= 0)."""
+    if not min_interval_seconds or min_interval_seconds <= 0:
+        return
+    bucket = _BUCKETS.get(min_interval_seconds)
+    if bucket is None:
+        with _BUCKETS_LOCK:
+            bucket = _BUCKETS.setdefault(min_interval_seconds, TokenBucket(1.0 / min_interval_seconds))
+    bucket.acquire()
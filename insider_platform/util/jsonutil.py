@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Optional: orjson is much faster than the stdlib for the small dict payloads we store.
+try:
+    import orjson as _orjson
+except Exception:  # pragma: no cover
+    _orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a compact JSON string (UTF-8 kept as-is, like ensure_ascii=False)."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # e.g. ints beyond 64 bits or non-str dict keys; the stdlib handles these.
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(s: str | bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(s)
+    return json.loads(s)
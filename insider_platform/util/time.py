@@ -1,11 +1,30 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime
+
+_ISO_FMT = "%Y-%m-%dT%H:%M:%SZ"
+_tls = threading.local()
+
+
+def iso_from_epoch(sec: int) -> str:
+    """UTC ISO-8601 string with Z (second precision) for a Unix timestamp."""
+    return time.strftime(_ISO_FMT, time.gmtime(sec))
 
 
 def utcnow_iso() -> str:
-    """Current UTC time as ISO-8601 string with Z."""
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    """Current UTC time as ISO-8601 string with Z.
+
+    Second precision, so the formatted string is memoized per thread for the current second.
+    """
+    sec = int(time.time())
+    cached = getattr(_tls, "iso", None)
+    if cached is not None and cached[0] == sec:
+        return cached[1]
+    s = iso_from_epoch(sec)
+    _tls.iso = (sec, s)
+    return s
 
 
 def iso_date(dt: datetime) -> str:
@@ -9,7 +9,7 @@ import requests
 
 from insider_platform.config import load_config
 from insider_platform.db import connect
-from insider_platform.jobs.queue import enqueue_job
+from insider_platform.jobs.queue import EnqueueSpec, enqueue_jobs_bulk
 
 
 def main() -> None:
@@ -44,17 +44,21 @@ def main() -> None:
     print(f"Found {len(accessions)} Form 4 accessions (limit={limit})")
 
     with connect(cfg.DB_DSN) as conn:
-        for acc in accessions:
-            enqueue_job(
-                conn,
-                job_type="FETCH_ACCESSION_DOCS",
-                dedupe_key=f"FETCH|{acc}",
-                payload={
-                    "accession_number": acc,
-                    "issuer_cik": issuer_cik,
-                },
-                priority=5,
-            )
+        enqueue_jobs_bulk(
+            conn,
+            [
+                EnqueueSpec(
+                    job_type="FETCH_ACCESSION_DOCS",
+                    dedupe_key=f"FETCH|{acc}",
+                    payload={
+                        "accession_number": acc,
+                        "issuer_cik": issuer_cik,
+                    },
+                    priority=5,
+                )
+                for acc in accessions
+            ],
+        )
 
     print("Enqueued.")
 
@@ -51,8 +51,9 @@ def _sqlite_tables(conn: sqlite3.Connection) -> List[str]:
 
 
 def _sqlite_columns(conn: sqlite3.Connection, table: str) -> List[str]:
-    rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-    return [str(r[1]) for r in rows]  # (cid, name, type, notnull, dflt_value, pk)
+    # Table-valued pragma (SQLite 3.16+): bound parameter, only the name column is returned.
+    rows = conn.execute("SELECT name FROM pragma_table_info(?) ORDER BY cid", (table,)).fetchall()
+    return [str(r[0]) for r in rows]
 
 
 def _pg_columns(cur: Any, table: str) -> List[str]:
@@ -61,6 +62,8 @@ def _pg_columns(cur: Any, table: str) -> List[str]:
         SELECT column_name
         FROM information_schema.columns
         WHERE table_schema='public' AND table_name=%s
+          -- Generated columns (e.g. event_outcomes.excess_return_*, jobs.dedupe_hash) can't be inserted.
+          AND is_generated = 'NEVER'
         ORDER BY ordinal_position
         """,
         (table,),
@@ -68,6 +71,14 @@ def _pg_columns(cur: Any, table: str) -> List[str]:
     return [str(r[0]) for r in cur.fetchall()]
 
 
+# SQLite stores these as hex text; Postgres holds the raw digest as BYTEA.
+_HEX_BYTEA_COLUMNS = {("form4_rows_raw", "owner_name_hash")}
+
+
+def _row_template(table: str, cols: Sequence[str]) -> str:
+    return "(" + ", ".join("decode(%s, 'hex')" if (table, c) in _HEX_BYTEA_COLUMNS else "%s" for c in cols) + ")"
+
+
 def _iter_sqlite_rows(
     conn: sqlite3.Connection, *, table: str, cols: Sequence[str], fetch_size: int
 ) -> Iterable[tuple[Any, ...]]:
@@ -199,6 +210,7 @@ def main() -> None:
                     col_list = ", ".join([f'"{c}"' for c in cols])
                     conflict_clause = " ON CONFLICT DO NOTHING" if args.on_conflict_do_nothing else ""
                     insert_sql = f"INSERT INTO \"{table}\" ({col_list}) VALUES %s{conflict_clause}"
+                    template = _row_template(table, cols)
 
                     buf: list[tuple[Any, ...]] = []
                     inserted = 0
@@ -206,12 +218,12 @@ def main() -> None:
                     for row in _iter_sqlite_rows(src, table=table, cols=cols, fetch_size=args.batch):
                         buf.append(row)
                         if len(buf) >= args.batch:
-                            psycopg2.extras.execute_values(cur, insert_sql, buf, page_size=len(buf))
+                            psycopg2.extras.execute_values(cur, insert_sql, buf, template=template, page_size=len(buf))
                             inserted += len(buf)
                             buf.clear()
 
                     if buf:
-                        psycopg2.extras.execute_values(cur, insert_sql, buf, page_size=len(buf))
+                        psycopg2.extras.execute_values(cur, insert_sql, buf, template=template, page_size=len(buf))
                         inserted += len(buf)
                         buf.clear()
 
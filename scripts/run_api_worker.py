@@ -13,7 +13,13 @@ def main() -> None:
     cfg = load_config()
     # Ensure DB schema/migrations are applied before the worker starts.
     init_db(cfg.DB_DSN)
-    run_worker_forever(cfg.DB_DSN, cfg, allowed_job_types=API_JOB_TYPES, enable_poller=True)
+    run_worker_forever(
+        cfg.DB_DSN,
+        cfg,
+        allowed_job_types=API_JOB_TYPES,
+        enable_poller=True,
+        concurrency=cfg.API_WORKER_CONCURRENCY,
+    )
 
 
 if __name__ == "__main__":
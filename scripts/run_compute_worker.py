@@ -14,7 +14,13 @@ def main() -> None:
     # Ensure DB schema/migrations are applied before the worker starts.
     init_db(cfg.DB_DSN)
     # Compute worker: no poller, no SEC/EODHD calls.
-    run_worker_forever(cfg.DB_DSN, cfg, allowed_job_types=COMPUTE_JOB_TYPES, enable_poller=False)
+    run_worker_forever(
+        cfg.DB_DSN,
+        cfg,
+        allowed_job_types=COMPUTE_JOB_TYPES,
+        enable_poller=False,
+        processes=cfg.COMPUTE_WORKER_PROCESSES,
+    )
 
 
 if __name__ == "__main__":